@@ -18,34 +18,71 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 import os
 import sys
 import asyncio
+from functools import lru_cache
 import click
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.database import init_db, get_db_session, Wallet, AirdropClaim
+from utils.env import ensure_env_loaded
+
+# Load environment variables
+ensure_env_loaded()
+
+# Use the libuv-backed event loop when available (optional dependency)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 from utils.logging_config import configure_logging, get_logger
-from modules.wallet_manager import WalletManager
-from modules.faucet_automation import FaucetOrchestrator
-from modules.action_pipeline import ActionPipeline
-from modules.airdrop_claimer import AirdropClaimer, AirdropRegistry
+
+# Database, HTTP and chain modules are imported inside the commands that use
+# them, so --help and shell completion don't pay for loading them
 
 console = Console()
 logger = get_logger(__name__)
 
 
-@click.group()
-@click.option('--log-level', default='INFO', help='Log level (DEBUG, INFO, WARNING, ERROR)')
-@click.option('--db-url', help='Database URL override')
+@lru_cache(maxsize=None)
+def get_wallet_manager():
+    """Get the shared WalletManager so seed derivation happens once per process."""
+    from modules.wallet_manager import WalletManager
+    
+    return WalletManager()
+
+
+def run_async(main):
+    """Run a coroutine to completion on a fresh event loop.
+    
+    On Python 3.12+ tasks start eagerly, so work that finishes without
+    awaiting (cooldown hits, skipped wallets) never goes through the loop.
+    
+    Args:
+        main: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    async def runner():
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        return await main
+    
+    return asyncio.run(runner())
+
+
+@click.group(context_settings={'auto_envvar_prefix': 'AIRDROP'})
+@click.option('--log-level', default='INFO', envvar='LOG_LEVEL', help='Log level (DEBUG, INFO, WARNING, ERROR)')
+@click.option('--db-url', envvar='DATABASE_URL', help='Database URL override')
 def cli(log_level, db_url):
     """Airdrop Farming - Multi-chain testnet automation by BYNNΛI."""
+    from utils.database import init_db
+    
     # Configure logging
     configure_logging(log_level=log_level)
     
@@ -56,15 +93,22 @@ def cli(log_level, db_url):
     console.print(f"Log level: {log_level}")
 
 
+def validate_word_count(ctx, param, value):
+    """Reject mnemonic word counts that are not a BIP39 length."""
+    if value not in (12, 15, 18, 21, 24):
+        raise click.BadParameter(f"{value} is not one of 12, 15, 18, 21, 24")
+    return value
+
+
 @cli.command()
 @click.option('--generate', is_flag=True, help='Generate a new seed mnemonic')
-@click.option('--word-count', default=24, type=click.Choice(['12', '24']), help='Word count for mnemonic')
+@click.option('--word-count', default=24, type=int, callback=validate_word_count, help='Word count for mnemonic (12, 15, 18, 21 or 24)')
 def seed(generate, word_count):
     """Manage wallet seed mnemonic."""
-    wallet_manager = WalletManager()
+    wallet_manager = get_wallet_manager()
     
     if generate:
-        mnemonic = wallet_manager.generate_mnemonic(int(word_count))
+        mnemonic = wallet_manager.generate_mnemonic(word_count)
         
         console.print("\n[bold red]IMPORTANT - SAVE THIS SECURELY![/bold red]")
         console.print("\n[yellow]Your new seed phrase:[/yellow]")
@@ -82,9 +126,10 @@ def seed(generate, word_count):
 @click.option('--count', default=100, help='Number of wallets to generate per chain')
 @click.option('--chains', default='evm,solana', help='Chains to generate wallets for (comma-separated)')
 @click.option('--shard-size', default=10, help='Wallets per shard')
-def create_wallets(count, chains, shard_size):
+@click.option('--quiet', is_flag=True, help='Disable the progress bar')
+def create_wallets(count, chains, shard_size, quiet):
     """Generate HD-derived wallets and store in database."""
-    wallet_manager = WalletManager()
+    wallet_manager = get_wallet_manager()
     
     if not wallet_manager.seed_mnemonic:
         console.print("[red]Error: No seed mnemonic configured. Run 'seed --generate' first.[/red]")
@@ -96,16 +141,22 @@ def create_wallets(count, chains, shard_size):
     console.print(f"Chains: {', '.join(chain_list)}")
     console.print(f"Shard size: {shard_size}\n")
     
-    with Progress() as progress:
-        task = progress.add_task("[cyan]Generating wallets...", total=count * len(chain_list))
-        
+    if quiet:
         generated = wallet_manager.generate_wallets(
             count=count,
             chains=chain_list,
             shard_size=shard_size
         )
-        
-        progress.update(task, completed=count * len(chain_list))
+    else:
+        with Progress(console=console) as progress:
+            task = progress.add_task("[cyan]Generating wallets...", total=count * len(chain_list))
+            
+            generated = wallet_manager.generate_wallets(
+                count=count,
+                chains=chain_list,
+                shard_size=shard_size,
+                progress_callback=lambda advance: progress.update(task, advance=advance)
+            )
     
     # Display summary
     table = Table(title="Generated Wallets")
@@ -125,27 +176,27 @@ def create_wallets(count, chains, shard_size):
 @click.option('--limit', default=20, help='Max wallets to display')
 def list_wallets(chain, shard, limit):
     """List generated wallets from database."""
-    wallet_manager = WalletManager()
-    wallets = wallet_manager.get_wallets(chain=chain, shard_id=shard)
+    wallet_manager = get_wallet_manager()
+    total = wallet_manager.count_wallets(chain=chain, shard_id=shard)
     
-    if not wallets:
+    if not total:
         console.print("[yellow]No wallets found.[/yellow]")
         return
     
-    table = Table(title=f"Wallets (showing {min(limit, len(wallets))} of {len(wallets)})")
+    table = Table(title=f"Wallets (showing {min(limit, total)} of {total})")
     table.add_column("ID", style="cyan")
     table.add_column("Address", style="green")
     table.add_column("Chain", style="yellow")
     table.add_column("Shard", style="magenta")
     table.add_column("Index", style="blue")
     
-    for wallet in wallets[:limit]:
+    for row in wallet_manager.list_wallets_summary(chain=chain, shard_id=shard, limit=limit):
         table.add_row(
-            str(wallet.id),
-            wallet.address[:10] + "..." + wallet.address[-8:],
-            wallet.chain,
-            str(wallet.shard_id),
-            str(wallet.derivation_index)
+            str(row.id),
+            row.address[:10] + "..." + row.address[-8:],
+            row.chain,
+            str(row.shard_id),
+            str(row.derivation_index)
         )
     
     console.print(table)
@@ -155,21 +206,22 @@ def list_wallets(chain, shard, limit):
 @click.option('--chains', help='Chains to fund (comma-separated, default: all)')
 @click.option('--shard', type=int, help='Only fund specific shard')
 @click.option('--limit', type=int, help='Limit number of wallets to fund')
-@click.option('--concurrency', default=5, help='Concurrent workers')
-def fund_wallets(chains, shard, limit, concurrency):
+@click.option('--concurrency', default=5, envvar='FAUCET_WORKER_CONCURRENCY', help='Concurrent workers')
+@click.option('--max-rate', type=float, envvar='MAX_REQUEST_RATE', help='Max requests per second per faucet host')
+def fund_wallets(chains, shard, limit, concurrency, max_rate):
     """Fund wallets using faucet automation."""
-    wallet_manager = WalletManager()
+    from utils.http import shared_session
+    from modules.faucet_automation import FaucetOrchestrator
+    
+    wallet_manager = get_wallet_manager()
     
     # Get wallets to fund
-    wallets = wallet_manager.get_wallets(shard_id=shard)
+    wallets = wallet_manager.get_wallets(shard_id=shard, limit=limit or None)
     
     if not wallets:
         console.print("[red]No wallets found. Create wallets first.[/red]")
         return
     
-    if limit:
-        wallets = wallets[:limit]
-    
     chain_list = None
     if chains:
         chain_list = [c.strip() for c in chains.split(',')]
@@ -179,18 +231,39 @@ def fund_wallets(chains, shard, limit, concurrency):
         console.print(f"Chains: {', '.join(chain_list)}")
     console.print(f"Concurrency: {concurrency}\n")
     
-    # Run faucet orchestrator
-    orchestrator = FaucetOrchestrator(concurrency=concurrency)
-    
     async def run_funding():
-        stats = await orchestrator.fund_wallets(
-            wallets=wallets,
-            chains=chain_list,
-            shard_stagger=True
-        )
+        # One pooled HTTP session for the whole run keeps faucet connections alive
+        async with shared_session() as session:
+            orchestrator = FaucetOrchestrator(
+                concurrency=concurrency,
+                max_rate=max_rate,
+                session=session
+            )
+            
+            # Chains are funded independently, so fan out one orchestration per
+            # chain on the same event loop and merge the per-chain stats
+            chain_results = await asyncio.gather(*[
+                orchestrator.fund_wallets(
+                    wallets=wallets,
+                    chains=[chain_name],
+                    shard_stagger=True
+                )
+                for chain_name in chain_list or orchestrator.config.get_all_chains()
+            ])
+        
+        stats = {
+            'total': len(wallets),
+            'success': 0,
+            'failed': 0,
+            'by_chain': {}
+        }
+        for chain_stats in chain_results:
+            stats['success'] += chain_stats['success']
+            stats['failed'] += chain_stats['failed']
+            stats['by_chain'].update(chain_stats['by_chain'])
         return stats
     
-    stats = asyncio.run(run_funding())
+    stats = run_async(run_funding())
     
     # Display results
     console.print("\n[bold]Funding Results:[/bold]")
@@ -223,18 +296,17 @@ def fund_wallets(chains, shard, limit, concurrency):
 @click.option('--concurrency', default=3, help='Concurrent actions')
 def run_actions(shard, chain, action, limit, concurrency):
     """Run eligibility actions (staking, swapping, bridging)."""
-    wallet_manager = WalletManager()
+    from modules.action_pipeline import ActionPipeline
+    
+    wallet_manager = get_wallet_manager()
     
     # Get wallets
-    wallets = wallet_manager.get_wallets(chain=chain, shard_id=shard)
+    wallets = wallet_manager.get_wallets(chain=chain, shard_id=shard, limit=limit or None)
     
     if not wallets:
         console.print("[red]No wallets found.[/red]")
         return
     
-    if limit:
-        wallets = wallets[:limit]
-    
     console.print(f"\n[bold]Running actions for {len(wallets)} wallets...[/bold]")
     console.print(f"Action type: {action}")
     console.print(f"Concurrency: {concurrency}\n")
@@ -282,7 +354,7 @@ def run_actions(shard, chain, action, limit, concurrency):
         )
         return stats
     
-    stats = asyncio.run(run_pipeline())
+    stats = run_async(run_pipeline())
     
     # Display results
     console.print("\n[bold]Action Results:[/bold]")
@@ -317,48 +389,60 @@ def check_balance():
 @cli.command()
 def stats():
     """Display statistics and metrics."""
-    from utils.database import FaucetRequest, WalletAction
+    from sqlalchemy import select, func, case
+    from utils.database import (
+        get_db_session, Wallet, FaucetRequest, WalletAction, AirdropClaim
+    )
     
     with get_db_session() as session:
         # Wallet stats
-        total_wallets = session.query(Wallet).count()
-        enabled_wallets = session.query(Wallet).filter(Wallet.enabled == True).count()
+        total_wallets, enabled_wallets = session.execute(
+            select(
+                func.count(Wallet.id),
+                func.sum(case((Wallet.enabled == True, 1), else_=0))
+            )
+        ).one()
         
         # Faucet stats
-        total_faucet_requests = session.query(FaucetRequest).count()
-        successful_requests = session.query(FaucetRequest).filter(
-            FaucetRequest.status == 'success'
-        ).count()
+        total_faucet_requests, successful_requests = session.execute(
+            select(
+                func.count(FaucetRequest.id),
+                func.sum(case((FaucetRequest.status == 'success', 1), else_=0))
+            )
+        ).one()
         
         # Action stats
-        total_actions = session.query(WalletAction).count()
-        successful_actions = session.query(WalletAction).filter(
-            WalletAction.status == 'success'
-        ).count()
+        total_actions, successful_actions = session.execute(
+            select(
+                func.count(WalletAction.id),
+                func.sum(case((WalletAction.status == 'success', 1), else_=0))
+            )
+        ).one()
         
         # Airdrop stats
-        total_claims = session.query(AirdropClaim).count()
-        successful_claims = session.query(AirdropClaim).filter(
-            AirdropClaim.status == 'claimed'
-        ).count()
-        eligible_claims = session.query(AirdropClaim).filter(
-            AirdropClaim.status == 'eligible'
-        ).count()
+        total_claims, successful_claims, eligible_claims = session.execute(
+            select(
+                func.count(AirdropClaim.id),
+                func.sum(case((AirdropClaim.status == 'claimed', 1), else_=0)),
+                func.sum(case((AirdropClaim.status == 'eligible', 1), else_=0))
+            )
+        ).one()
     
     # Display stats
     table = Table(title="Statistics")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
     
+    # SUM() over an empty table yields NULL, so coerce to 0 for display
     table.add_row("Total Wallets", str(total_wallets))
-    table.add_row("Enabled Wallets", str(enabled_wallets))
+    table.add_row("Enabled Wallets", str(enabled_wallets or 0))
     table.add_row("Faucet Requests", str(total_faucet_requests))
-    table.add_row("Successful Faucet Claims", str(successful_requests))
+    table.add_row("Successful Faucet Claims", str(successful_requests or 0))
     table.add_row("Total Actions", str(total_actions))
-    table.add_row("Successful Actions", str(successful_actions))
+    table.add_row("Successful Actions", str(successful_actions or 0))
     table.add_row("Airdrop Claims Checked", str(total_claims))
-    table.add_row("Airdrops Eligible", str(eligible_claims))
-    table.add_row("Airdrops Claimed", str(successful_claims))
+    table.add_row("Airdrops Eligible", str(eligible_claims or 0))
+    table.add_row("Airdrops Claimed", str(successful_claims or 0))
     
     console.print("\n")
     console.print(table)
@@ -368,6 +452,8 @@ def stats():
 @cli.command()
 def list_airdrops():
     """List all configured airdrops and their status."""
+    from modules.airdrop_claimer import AirdropRegistry
+    
     registry = AirdropRegistry()
     airdrops = registry.get_all_airdrops()
     
@@ -413,20 +499,21 @@ def list_airdrops():
 @click.option('--shard', type=int, help='Only process specific shard')
 @click.option('--chain', help='Filter by chain')
 @click.option('--limit', type=int, help='Limit number of wallets to process')
-def claim_airdrops(airdrop, check_only, shard, chain, limit):
+@click.option('--max-rate', type=float, envvar='MAX_REQUEST_RATE', help='Max claim requests per second per endpoint host')
+@click.option('--concurrency', type=int, envvar='MAX_CONCURRENT_ACTIONS', help='Wallets processed concurrently')
+def claim_airdrops(airdrop, check_only, shard, chain, limit, max_rate, concurrency):
     """Check eligibility and claim available airdrops."""
-    wallet_manager = WalletManager()
+    from modules.airdrop_claimer import AirdropClaimer
+    
+    wallet_manager = get_wallet_manager()
     
     # Get wallets
-    wallets = wallet_manager.get_wallets(chain=chain, shard_id=shard)
+    wallets = wallet_manager.get_wallets(chain=chain, shard_id=shard, limit=limit or None)
     
     if not wallets:
         console.print("[red]No wallets found.[/red]")
         return
     
-    if limit:
-        wallets = wallets[:limit]
-    
     mode = "Checking eligibility" if check_only else "Claiming airdrops"
     console.print(f"\n[bold]{mode} for {len(wallets)} wallets...[/bold]")
     
@@ -443,7 +530,11 @@ def claim_airdrops(airdrop, check_only, shard, chain, limit):
     console.print()
     
     # Run claimer
-    claimer = AirdropClaimer()
+    claimer = AirdropClaimer(
+        wallet_manager=wallet_manager,
+        max_rate=max_rate,
+        concurrency=concurrency
+    )
     
     async def run_claims():
         stats = await claimer.check_and_claim_airdrops(
@@ -454,7 +545,7 @@ def claim_airdrops(airdrop, check_only, shard, chain, limit):
         )
         return stats
     
-    stats = asyncio.run(run_claims())
+    stats = run_async(run_claims())
     
     # Display results
     console.print("\n[bold]Results:[/bold]")
@@ -12,6 +12,6 @@ License: MIT
 Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
-from .settings import Config
+from .settings import Config, Settings
 
-__all__ = ['Config']
\ No newline at end of file
+__all__ = ['Config', 'Settings']
\ No newline at end of file
@@ -16,148 +16,191 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass, field
+from typing import Dict
+from utils.env import ensure_env_loaded
 
-load_dotenv()
+ensure_env_loaded()
 
-class Config:
+
+def _env(name: str, default: str = ''):
+    """Read a string setting from the environment at load time."""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+def _env_int(name: str, default: int):
+    """Read an integer setting from the environment at load time."""
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+def _env_float(name: str, default: float):
+    """Read a float setting from the environment at load time."""
+    return field(default_factory=lambda: float(os.getenv(name, default)))
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable application settings, loaded once from the environment."""
+    
     # Wallet Settings
-    MAX_WALLETS = 50
-    WALLET_ENCRYPTION_ENABLED = True
+    MAX_WALLETS: int = 50
+    WALLET_ENCRYPTION_ENABLED: bool = True
     
     # Network Settings
-    TESTNET_MODE = os.getenv('TESTNET_MODE', 'true').lower() == 'true'
-    SOLANA_NETWORK = 'devnet' if TESTNET_MODE else 'mainnet-beta'
-    ETH_NETWORK = 'sepolia' if TESTNET_MODE else 'mainnet'
+    TESTNET_MODE: bool = field(
+        default_factory=lambda: os.getenv('TESTNET_MODE', 'true').lower() == 'true'
+    )
     
     # RPC Endpoints
-    SOLANA_RPC = {
+    SOLANA_RPC: Dict[str, str] = field(default_factory=lambda: {
         'mainnet': os.getenv('SOLANA_RPC_MAINNET', 'https://api.mainnet-beta.solana.com'),
         'testnet': os.getenv('SOLANA_RPC_TESTNET', 'https://api.testnet.solana.com'),
         'devnet': os.getenv('SOLANA_RPC_DEVNET', 'https://api.devnet.solana.com')
-    }
+    })
     
-    ETH_RPC = {
+    ETH_RPC: Dict[str, str] = field(default_factory=lambda: {
         'mainnet': os.getenv('ETH_RPC_MAINNET', 'https://eth.llamarpc.com'),
         'sepolia': os.getenv('ETH_RPC_SEPOLIA', 'https://rpc.sepolia.org')
-    }
+    })
+    
+    # Active RPC URLs for the current mode (populated in __post_init__)
+    SOLANA_ACTIVE_RPC: str = field(init=False)
+    ETH_ACTIVE_RPC: str = field(init=False)
+    _ACTIVE_RPC: Dict[str, str] = field(init=False, repr=False)
     
     # Timing Settings (in seconds)
-    MIN_DELAY = int(os.getenv('MIN_DELAY_SECONDS', 30))
-    MAX_DELAY = int(os.getenv('MAX_DELAY_SECONDS', 120))
-    FAUCET_RETRY_DELAY = 300  # 5 minutes
-    TRANSACTION_TIMEOUT = 60
+    MIN_DELAY: int = _env_int('MIN_DELAY_SECONDS', 30)
+    MAX_DELAY: int = _env_int('MAX_DELAY_SECONDS', 120)
+    FAUCET_RETRY_DELAY: int = 300  # 5 minutes
+    TRANSACTION_TIMEOUT: int = 60
     
     # Activity Limits
-    DAILY_TRANSACTIONS_PER_WALLET = int(os.getenv('DAILY_TRANSACTIONS_PER_WALLET', 10))
-    MAX_SWAP_ATTEMPTS = 3
-    MAX_FAUCET_ATTEMPTS = 5
+    DAILY_TRANSACTIONS_PER_WALLET: int = _env_int('DAILY_TRANSACTIONS_PER_WALLET', 10)
+    MAX_SWAP_ATTEMPTS: int = 3
+    MAX_FAUCET_ATTEMPTS: int = 5
     
     # Swap Settings
-    SLIPPAGE_TOLERANCE = 0.03  # 3%
-    MIN_SWAP_AMOUNT = 0.01
-    MAX_SWAP_AMOUNT = 0.5
+    SLIPPAGE_TOLERANCE: float = 0.03  # 3%
+    MIN_SWAP_AMOUNT: float = 0.01
+    MAX_SWAP_AMOUNT: float = 0.5
     
     # Staking Settings
-    STAKE_PERCENTAGE = 0.6  # Stake 60% of balance
-    MIN_STAKE_AMOUNT = 0.1
-    VALIDATOR_ROTATION_DAYS = 14
+    STAKE_PERCENTAGE: float = 0.6  # Stake 60% of balance
+    MIN_STAKE_AMOUNT: float = 0.1
+    VALIDATOR_ROTATION_DAYS: int = 14
     
     # Bridge Settings
-    MIN_BRIDGE_AMOUNT = 0.1
-    MAX_BRIDGE_AMOUNT = 0.3
-    BRIDGE_COOLDOWN_HOURS = 6
+    MIN_BRIDGE_AMOUNT: float = 0.1
+    MAX_BRIDGE_AMOUNT: float = 0.3
+    BRIDGE_COOLDOWN_HOURS: int = 6
     
     # Proxy Settings
-    USE_PROXIES = True
-    PROXY_ROTATION_ENABLED = True
-    PROXY_TIMEOUT = 30
+    USE_PROXIES: bool = True
+    PROXY_ROTATION_ENABLED: bool = True
+    PROXY_TIMEOUT: int = 30
     
     # Captcha Settings
-    TWOCAPTCHA_API_KEY = os.getenv('TWOCAPTCHA_API_KEY', '')
-    ANTICAPTCHA_API_KEY = os.getenv('ANTICAPTCHA_API_KEY', '')
-    CAPTCHA_TIMEOUT = 120
+    TWOCAPTCHA_API_KEY: str = _env('TWOCAPTCHA_API_KEY')
+    ANTICAPTCHA_API_KEY: str = _env('ANTICAPTCHA_API_KEY')
+    CAPTCHA_TIMEOUT: int = 120
     
     # Database
-    DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/bot.db')
+    DATABASE_PATH: str = _env('DATABASE_PATH', 'data/bot.db')
     
     # Logging
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'logs/bot.log')
-    LOG_ROTATION = '100 MB'
-    LOG_RETENTION = '30 days'
+    LOG_LEVEL: str = _env('LOG_LEVEL', 'INFO')
+    LOG_FILE: str = _env('LOG_FILE', 'logs/bot.log')
+    LOG_ROTATION: str = '100 MB'
+    LOG_RETENTION: str = '30 days'
     
     # Anti-Detection: Basic
-    RANDOMIZE_USER_AGENT = True
-    HUMAN_LIKE_DELAYS = True
-    BEHAVIOR_PATTERNS = {
+    RANDOMIZE_USER_AGENT: bool = True
+    HUMAN_LIKE_DELAYS: bool = True
+    BEHAVIOR_PATTERNS: Dict[str, Dict[str, int]] = field(default_factory=lambda: {
         'early_bird': {'start_hour': 6, 'end_hour': 10},
         'day_trader': {'start_hour': 10, 'end_hour': 18},
         'night_owl': {'start_hour': 20, 'end_hour': 2}
-    }
+    })
     
     # Anti-Detection: IP Management
-    IP_SHARD_SIZE = int(os.getenv('IP_SHARD_SIZE', 10))
-    IP_STICKY_HOURS = float(os.getenv('IP_STICKY_HOURS', 24.0))
-    FAUCET_IP_STICKY_HOURS = float(os.getenv('FAUCET_IP_STICKY_HOURS', 24.0))
-    RPC_IP_STICKY_HOURS = float(os.getenv('RPC_IP_STICKY_HOURS', 12.0))
-    IP_ROTATION_JITTER_PCT = float(os.getenv('IP_ROTATION_JITTER_PCT', 0.2))
+    IP_SHARD_SIZE: int = _env_int('IP_SHARD_SIZE', 10)
+    IP_STICKY_HOURS: float = _env_float('IP_STICKY_HOURS', 24.0)
+    FAUCET_IP_STICKY_HOURS: float = _env_float('FAUCET_IP_STICKY_HOURS', 24.0)
+    RPC_IP_STICKY_HOURS: float = _env_float('RPC_IP_STICKY_HOURS', 12.0)
+    IP_ROTATION_JITTER_PCT: float = _env_float('IP_ROTATION_JITTER_PCT', 0.2)
     
     # Anti-Detection: User-Agent Rotation
-    UA_POOL_PATH = os.getenv('UA_POOL_PATH', '')
-    UA_LIST = os.getenv('UA_LIST', '')
-    UA_SESSION_DURATION_HOURS = float(os.getenv('UA_SESSION_DURATION_HOURS', 12.0))
+    UA_POOL_PATH: str = _env('UA_POOL_PATH')
+    UA_LIST: str = _env('UA_LIST')
+    UA_SESSION_DURATION_HOURS: float = _env_float('UA_SESSION_DURATION_HOURS', 12.0)
     
     # Anti-Detection: Scheduling Entropy
-    OFF_DAYS = os.getenv('OFF_DAYS', '')
-    NIGHT_LULL_WINDOWS = os.getenv('NIGHT_LULL_WINDOWS', '0-6,22-24')
-    DAYPART_WINDOWS = os.getenv('DAYPART_WINDOWS', 'morning:6-12,afternoon:12-18,evening:18-22')
-    WEEKEND_ACTIVITY_REDUCTION = float(os.getenv('WEEKEND_ACTIVITY_REDUCTION', 0.3))
-    NIGHT_ACTIVITY_REDUCTION = float(os.getenv('NIGHT_ACTIVITY_REDUCTION', 0.5))
+    OFF_DAYS: str = _env('OFF_DAYS')
+    NIGHT_LULL_WINDOWS: str = _env('NIGHT_LULL_WINDOWS', '0-6,22-24')
+    DAYPART_WINDOWS: str = _env('DAYPART_WINDOWS', 'morning:6-12,afternoon:12-18,evening:18-22')
+    WEEKEND_ACTIVITY_REDUCTION: float = _env_float('WEEKEND_ACTIVITY_REDUCTION', 0.3)
+    NIGHT_ACTIVITY_REDUCTION: float = _env_float('NIGHT_ACTIVITY_REDUCTION', 0.5)
     
     # Anti-Detection: Faucet Behavior
-    OVER_COOLDOWN_JITTER_MIN = float(os.getenv('OVER_COOLDOWN_JITTER_MIN', 0.1))
-    OVER_COOLDOWN_JITTER_MAX = float(os.getenv('OVER_COOLDOWN_JITTER_MAX', 0.3))
-    FAUCET_SKIP_PROB = float(os.getenv('FAUCET_SKIP_PROB', 0.05))
-    ACTION_SKIP_PROB = float(os.getenv('ACTION_SKIP_PROB', 0.1))
+    OVER_COOLDOWN_JITTER_MIN: float = _env_float('OVER_COOLDOWN_JITTER_MIN', 0.1)
+    OVER_COOLDOWN_JITTER_MAX: float = _env_float('OVER_COOLDOWN_JITTER_MAX', 0.3)
+    FAUCET_SKIP_PROB: float = _env_float('FAUCET_SKIP_PROB', 0.05)
+    ACTION_SKIP_PROB: float = _env_float('ACTION_SKIP_PROB', 0.1)
     
     # Anti-Detection: Auto-Throttle
-    AUTO_THROTTLE_ERROR_THRESHOLD = float(os.getenv('AUTO_THROTTLE_ERROR_THRESHOLD', 0.3))
-    AUTO_THROTTLE_ERROR_WINDOW = int(os.getenv('AUTO_THROTTLE_ERROR_WINDOW', 300))
-    AUTO_THROTTLE_MIN_SAMPLES = int(os.getenv('AUTO_THROTTLE_MIN_SAMPLES', 10))
-    AUTO_THROTTLE_PAUSE_DURATION = int(os.getenv('AUTO_THROTTLE_PAUSE_DURATION', 600))
-    AUTO_THROTTLE_BACKOFF_MULTIPLIER = float(os.getenv('AUTO_THROTTLE_BACKOFF_MULTIPLIER', 2.0))
-    AUTO_THROTTLE_MAX_PAUSE = int(os.getenv('AUTO_THROTTLE_MAX_PAUSE', 3600))
+    AUTO_THROTTLE_ERROR_THRESHOLD: float = _env_float('AUTO_THROTTLE_ERROR_THRESHOLD', 0.3)
+    AUTO_THROTTLE_ERROR_WINDOW: int = _env_int('AUTO_THROTTLE_ERROR_WINDOW', 300)
+    AUTO_THROTTLE_MIN_SAMPLES: int = _env_int('AUTO_THROTTLE_MIN_SAMPLES', 10)
+    AUTO_THROTTLE_PAUSE_DURATION: int = _env_int('AUTO_THROTTLE_PAUSE_DURATION', 600)
+    AUTO_THROTTLE_BACKOFF_MULTIPLIER: float = _env_float('AUTO_THROTTLE_BACKOFF_MULTIPLIER', 2.0)
+    AUTO_THROTTLE_MAX_PAUSE: int = _env_int('AUTO_THROTTLE_MAX_PAUSE', 3600)
     
     # Transaction Gas Settings
-    GAS_PRICE_MULTIPLIER = 1.1
-    MAX_PRIORITY_FEE = 0.0001  # SOL
+    GAS_PRICE_MULTIPLIER: float = 1.1
+    MAX_PRIORITY_FEE: float = 0.0001  # SOL
     
     # Error Handling
-    MAX_RETRIES = 3
-    RETRY_BACKOFF_FACTOR = 2
-    
-    @classmethod
-    def get_rpc_url(cls, chain='solana'):
+    MAX_RETRIES: int = 3
+    RETRY_BACKOFF_FACTOR: int = 2
+    
+    def __post_init__(self):
+        # Resolve the active RPC endpoints once instead of on every lookup
+        object.__setattr__(
+            self, 'SOLANA_ACTIVE_RPC', self.SOLANA_RPC.get(self.SOLANA_NETWORK)
+        )
+        object.__setattr__(self, 'ETH_ACTIVE_RPC', self.ETH_RPC.get(self.ETH_NETWORK))
+        object.__setattr__(self, '_ACTIVE_RPC', {
+            'solana': self.SOLANA_ACTIVE_RPC,
+            'ethereum': self.ETH_ACTIVE_RPC
+        })
+    
+    @property
+    def SOLANA_NETWORK(self) -> str:
+        return 'devnet' if self.TESTNET_MODE else 'mainnet-beta'
+    
+    @property
+    def ETH_NETWORK(self) -> str:
+        return 'sepolia' if self.TESTNET_MODE else 'mainnet'
+    
+    def get_rpc_url(self, chain='solana'):
         """Get appropriate RPC URL based on chain and mode"""
-        if chain == 'solana':
-            return cls.SOLANA_RPC[cls.SOLANA_NETWORK]
-        elif chain == 'ethereum':
-            return cls.ETH_RPC[cls.ETH_NETWORK]
-        return None
-    
-    @classmethod
-    def validate_config(cls):
+        return self._ACTIVE_RPC.get(chain)
+    
+    def validate_config(self):
         """Validate required configuration"""
         errors = []
         
-        if not cls.TWOCAPTCHA_API_KEY and not cls.ANTICAPTCHA_API_KEY:
+        if not self.TWOCAPTCHA_API_KEY and not self.ANTICAPTCHA_API_KEY:
             errors.append('At least one captcha service API key required')
         
-        if cls.MIN_DELAY >= cls.MAX_DELAY:
+        if self.MIN_DELAY >= self.MAX_DELAY:
             errors.append('MIN_DELAY must be less than MAX_DELAY')
         
-        if cls.DAILY_TRANSACTIONS_PER_WALLET < 1:
+        if self.DAILY_TRANSACTIONS_PER_WALLET < 1:
             errors.append('DAILY_TRANSACTIONS_PER_WALLET must be at least 1')
         
-        return errors if errors else None
\ No newline at end of file
+        return errors if errors else None
+
+
+# Shared settings instance, populated from the environment once at import
+Config = Settings()
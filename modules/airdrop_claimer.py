@@ -19,21 +19,55 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
 import os
+import copy
 import yaml
 import asyncio
 import random
-from typing import Dict, List, Optional, Tuple
+import secrets
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 from dateutil import parser as date_parser
-from tenacity import retry, stop_after_attempt, wait_exponential
+from sqlalchemy import func, select, update
 
 from utils.database import get_db_session, AirdropClaim, Wallet, WalletAction
 from utils.logging_config import get_logger
 from modules.wallet_manager import WalletManager
 from modules.anti_detection import AntiDetection
+from modules.backoff import backoff_with_jitter
+from modules.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
+# Claim attempts for errors that may succeed on retry; anything else fails at once
+CLAIM_ATTEMPTS = 3
+TRANSIENT_CLAIM_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed airdrop configs and claim windows keyed by absolute path, tagged
+# with (mtime_ns, size)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict, Dict]] = {}
+
+
+def _parse_datetime(value) -> datetime:
+    """Parse a config date, trying the C ISO-8601 parser before dateutil.
+    
+    Args:
+        value: ISO-8601 string, other date string, or datetime from YAML
+        
+    Returns:
+        Parsed datetime
+    """
+    if isinstance(value, datetime):
+        return value
+    
+    try:
+        # fromisoformat() only accepts a trailing 'Z' from Python 3.11
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return date_parser.parse(value)
+
 
 class AirdropRegistry:
     """Manage airdrop configurations and registry."""
@@ -46,6 +80,7 @@ class AirdropRegistry:
         """
         self.config_path = config_path
         self.airdrops = {}
+        self.claim_windows: Dict[str, Optional[Tuple[datetime, datetime]]] = {}
         self.load_config()
     
     def load_config(self):
@@ -58,14 +93,33 @@ class AirdropRegistry:
             return
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            # Reuse the last parse while the file is unchanged on disk
+            path = os.path.abspath(self.config_path)
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            
+            # Each registry gets its own copy so callers mutating a config
+            # dict cannot change what later registries see
+            cached = _CONFIG_CACHE.get(path)
+            if cached and cached[0] == signature:
+                self.airdrops = copy.deepcopy(cached[1])
+                self.claim_windows = dict(cached[2])
+                return
+            
+            with open(self.config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
             
             if not config or 'airdrops' not in config:
                 logger.warning("airdrop_config_empty", config_path=self.config_path)
                 return
             
             self.airdrops = config['airdrops']
+            self.claim_windows = self._parse_claim_windows(self.airdrops)
+            _CONFIG_CACHE[path] = (
+                signature,
+                copy.deepcopy(self.airdrops),
+                dict(self.claim_windows)
+            )
             
             logger.info(
                 "airdrop_config_loaded",
@@ -80,6 +134,43 @@ class AirdropRegistry:
                 error=str(e)
             )
     
+    @staticmethod
+    def _parse_claim_windows(
+        airdrops: Dict[str, Dict]
+    ) -> Dict[str, Optional[Tuple[datetime, datetime]]]:
+        """Parse each airdrop's claim window once at load time.
+        
+        Args:
+            airdrops: Airdrop configurations by name
+            
+        Returns:
+            Dictionary of (claim_start, claim_end) by airdrop name, or None
+            where the dates could not be parsed
+        """
+        windows = {}
+        
+        for name, config in airdrops.items():
+            try:
+                claim_start = _parse_datetime(config.get('claim_start', '2000-01-01T00:00:00Z'))
+                claim_end = _parse_datetime(config.get('claim_end', '2099-12-31T23:59:59Z'))
+                
+                # Dates without an offset are taken as UTC
+                if claim_start.tzinfo is None:
+                    claim_start = claim_start.replace(tzinfo=timezone.utc)
+                if claim_end.tzinfo is None:
+                    claim_end = claim_end.replace(tzinfo=timezone.utc)
+                
+                windows[name] = (claim_start, claim_end)
+            except Exception as e:
+                logger.warning(
+                    "airdrop_date_parse_failed",
+                    airdrop=name,
+                    error=str(e)
+                )
+                windows[name] = None
+        
+        return windows
+    
     def get_airdrop(self, name: str) -> Optional[Dict]:
         """Get airdrop configuration by name.
         
@@ -125,18 +216,9 @@ class AirdropRegistry:
                 continue
             
             # Check claim window
-            try:
-                claim_start = date_parser.parse(config.get('claim_start', '2000-01-01T00:00:00Z'))
-                claim_end = date_parser.parse(config.get('claim_end', '2099-12-31T23:59:59Z'))
-                
-                if claim_start <= now <= claim_end:
-                    active[name] = config
-            except Exception as e:
-                logger.warning(
-                    "airdrop_date_parse_failed",
-                    airdrop=name,
-                    error=str(e)
-                )
+            window = self.claim_windows.get(name)
+            if window and window[0] <= now <= window[1]:
+                active[name] = config
         
         return active
     
@@ -156,62 +238,108 @@ class AirdropRegistry:
         }
 
 
+# Registry shared by every AirdropClaimer in the process
+_registry: Optional[AirdropRegistry] = None
+
+
+def get_registry() -> AirdropRegistry:
+    """Get the shared airdrop registry, loading it on first use.
+    
+    Returns:
+        AirdropRegistry for the default config path
+    """
+    global _registry
+    if _registry is None:
+        _registry = AirdropRegistry()
+    return _registry
+
+
 class EligibilityChecker:
     """Check wallet eligibility for airdrops."""
     
     def __init__(self):
         """Initialize eligibility checker."""
-        pass
+        # Method-specific checks; direct claims need only the basic checks
+        self._method_checks = {
+            'merkle': self._check_merkle_eligibility,
+            'api': self._check_api_eligibility
+        }
+    
+    def get_action_counts(
+        self,
+        wallet_ids: List[int],
+        batch_size: int = 500
+    ) -> Dict[int, Dict[str, int]]:
+        """Count successful actions by type for many wallets.
+        
+        Replaces one query per wallet with one grouped query per batch of ids.
+        
+        Args:
+            wallet_ids: Wallet IDs to count actions for
+            batch_size: IDs per IN (...) query
+            
+        Returns:
+            Dictionary of {action_type: count} by wallet ID; wallets without
+            successful actions map to an empty dict
+        """
+        counts = {wallet_id: {} for wallet_id in wallet_ids}
+        
+        for start in range(0, len(wallet_ids), batch_size):
+            batch = wallet_ids[start:start + batch_size]
+            
+            with get_db_session() as session:
+                rows = session.execute(
+                    select(
+                        WalletAction.wallet_id,
+                        WalletAction.action_type,
+                        func.count()
+                    ).where(
+                        WalletAction.wallet_id.in_(batch),
+                        WalletAction.status == 'success'
+                    ).group_by(WalletAction.wallet_id, WalletAction.action_type)
+                ).all()
+            
+            for wallet_id, action_type, count in rows:
+                counts[wallet_id][action_type] = count
+        
+        return counts
     
     async def check_eligibility(
         self,
         wallet: Wallet,
-        airdrop_config: Dict
+        airdrop_config: Dict,
+        action_counts: Optional[Dict[str, int]] = None
     ) -> Tuple[bool, Optional[str], Optional[Dict]]:
         """Check if wallet is eligible for an airdrop.
         
         Args:
             wallet: Wallet database record
             airdrop_config: Airdrop configuration
+            action_counts: Successful action counts by type for this wallet,
+                as returned by get_action_counts (queried if omitted)
             
         Returns:
             Tuple of (is_eligible, reason, metadata)
         """
         airdrop_name = airdrop_config.get('name', 'Unknown')
         
+        # Check chain match first; it needs no database or network round-trip
+        if wallet.chain != airdrop_config.get('chain'):
+            reason = f"Chain mismatch: {wallet.chain} != {airdrop_config.get('chain')}"
+            return False, reason, None
+        
         # Check required actions
         min_actions = airdrop_config.get('min_actions', 0)
         required_actions = airdrop_config.get('required_actions', [])
         
-        # Query wallet actions from database
-        with get_db_session() as session:
-            wallet_actions = session.query(WalletAction).filter(
-                WalletAction.wallet_id == wallet.id,
-                WalletAction.status == 'success'
-            ).all()
-            
-            # Count actions by type
-            action_counts = {}
-            for action in wallet_actions:
-                action_type = action.action_type
-                action_counts[action_type] = action_counts.get(action_type, 0) + 1
-            
-            # Check if required actions are met
-            for req_action in required_actions:
-                if action_counts.get(req_action, 0) == 0:
-                    reason = f"Missing required action: {req_action}"
-                    logger.debug(
-                        "wallet_ineligible",
-                        wallet=wallet.address[:10],
-                        airdrop=airdrop_name,
-                        reason=reason
-                    )
-                    return False, reason, None
-            
-            # Check minimum action count
-            total_actions = sum(action_counts.values())
-            if total_actions < min_actions:
-                reason = f"Insufficient actions: {total_actions}/{min_actions}"
+        # Count wallet actions by type
+        if action_counts is None:
+            action_counts = self.get_action_counts([wallet.id])[wallet.id]
+        
+        # Check if required actions are met
+        for req_action in required_actions:
+            if action_counts.get(req_action, 0) == 0:
+                reason = f"Missing required action: {req_action}"
                 logger.debug(
                     "wallet_ineligible",
                     wallet=wallet.address[:10],
@@ -220,23 +348,30 @@ class EligibilityChecker:
                 )
                 return False, reason, None
         
-        # Check chain match
-        if wallet.chain != airdrop_config.get('chain'):
-            reason = f"Chain mismatch: {wallet.chain} != {airdrop_config.get('chain')}"
+        # Check minimum action count
+        total_actions = sum(action_counts.values())
+        if total_actions < min_actions:
+            reason = f"Insufficient actions: {total_actions}/{min_actions}"
+            logger.debug(
+                "wallet_ineligible",
+                wallet=wallet.address[:10],
+                airdrop=airdrop_name,
+                reason=reason
+            )
             return False, reason, None
         
         # Perform method-specific eligibility check
         claim_method = airdrop_config.get('claim_method', 'direct')
         
-        if claim_method == 'merkle':
-            return await self._check_merkle_eligibility(wallet, airdrop_config)
-        elif claim_method == 'api':
-            return await self._check_api_eligibility(wallet, airdrop_config)
-        elif claim_method == 'direct':
+        if claim_method == 'direct':
             # For direct claims, basic checks are sufficient
             return True, "Eligible for direct claim", {'action_counts': action_counts}
-        else:
+        
+        method_check = self._method_checks.get(claim_method)
+        if method_check is None:
             return False, f"Unknown claim method: {claim_method}", None
+        
+        return await method_check(wallet, airdrop_config)
     
     async def _check_merkle_eligibility(
         self,
@@ -324,18 +459,33 @@ class AirdropClaimer:
     def __init__(
         self,
         wallet_manager: Optional[WalletManager] = None,
-        anti_detection: Optional[AntiDetection] = None
+        anti_detection: Optional[AntiDetection] = None,
+        max_rate: Optional[float] = None,
+        concurrency: Optional[int] = None
     ):
         """Initialize airdrop claimer.
         
         Args:
             wallet_manager: Wallet manager instance
             anti_detection: Anti-detection module instance
+            max_rate: Max claim requests per second per (chain, endpoint host)
+            concurrency: Max wallets processed at once
         """
+        self.concurrency = concurrency or int(
+            os.getenv("MAX_CONCURRENT_ACTIONS", "5")
+        )
         self.wallet_manager = wallet_manager or WalletManager()
         self.anti_detection = anti_detection or AntiDetection()
-        self.registry = AirdropRegistry()
+        self.rate_limiter = RateLimiter(max_rate=max_rate)
+        self.registry = get_registry()
         self.eligibility_checker = EligibilityChecker()
+        
+        # Claim handlers by claim_method
+        self._claim_handlers = {
+            'merkle': self._claim_merkle,
+            'api': self._claim_api,
+            'direct': self._claim_direct
+        }
     
     async def check_and_claim_airdrops(
         self,
@@ -386,114 +536,228 @@ class AirdropClaimer:
             check_only=check_only
         )
         
-        # Process each wallet
-        for wallet in wallets:
-            # Apply anti-detection skip logic
-            if self.anti_detection.should_skip_action(wallet.address):
-                stats['skipped'] += 1
-                continue
-            
-            # Check each airdrop
-            for airdrop_name, airdrop_config in airdrops_to_check.items():
-                stats['total_checks'] += 1
-                
-                # Check if already claimed
-                with get_db_session() as session:
-                    existing_claim = session.query(AirdropClaim).filter(
-                        AirdropClaim.wallet_id == wallet.id,
-                        AirdropClaim.airdrop_name == airdrop_name,
-                        AirdropClaim.status == 'claimed'
-                    ).first()
-                    
-                    if existing_claim:
-                        logger.debug(
-                            "already_claimed",
-                            wallet=wallet.address[:10],
-                            airdrop=airdrop_name
-                        )
-                        continue
-                
-                # Check eligibility
-                is_eligible, reason, metadata = await self.eligibility_checker.check_eligibility(
-                    wallet, airdrop_config
+        # Load action counts and existing claims for every wallet in one pass
+        wallet_ids = [wallet.id for wallet in wallets]
+        action_counts_by_wallet = self.eligibility_checker.get_action_counts(wallet_ids)
+        claimed_pairs = self._get_claimed_pairs(wallet_ids, list(airdrops_to_check))
+        
+        # Check results are written in batches rather than one commit each
+        pending_checks = []
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def process_with_semaphore(wallet):
+            async with semaphore:
+                await self._check_and_claim_wallet(
+                    wallet,
+                    airdrops_to_check,
+                    check_only,
+                    stats,
+                    action_counts_by_wallet[wallet.id],
+                    claimed_pairs,
+                    pending_checks
                 )
-                
-                # Record check result
-                self._record_check(wallet, airdrop_name, airdrop_config, is_eligible, reason)
-                
-                if not is_eligible:
-                    stats['ineligible'] += 1
-                    continue
-                
-                stats['eligible'] += 1
-                
-                # Claim if not check-only mode
-                if not check_only:
-                    # Add human-like delay
-                    delay = self.anti_detection.get_jittered_delay(
-                        base_delay=random.uniform(2.0, 5.0)
-                    )
-                    await asyncio.sleep(delay)
-                    
-                    # Execute claim
-                    success = await self._execute_claim(
-                        wallet, airdrop_name, airdrop_config, metadata
-                    )
-                    
-                    if success:
-                        stats['claimed'] += 1
-                    else:
-                        stats['failed'] += 1
+        
+        # Wallets are independent, so their checks and claims can overlap
+        try:
+            results = await asyncio.gather(
+                *(process_with_semaphore(wallet) for wallet in wallets),
+                return_exceptions=True
+            )
+        finally:
+            self._record_checks(pending_checks)
+        
+        for wallet, result in zip(wallets, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "airdrop_wallet_failed",
+                    wallet=wallet.address[:10],
+                    error=str(result)
+                )
+                stats['failed'] += 1
         
         logger.info("airdrop_check_complete", stats=stats)
         return stats
     
-    def _record_check(
+    async def _check_and_claim_wallet(
         self,
         wallet: Wallet,
-        airdrop_name: str,
-        airdrop_config: Dict,
-        is_eligible: bool,
-        reason: Optional[str]
+        airdrops_to_check: Dict[str, Dict],
+        check_only: bool,
+        stats: Dict,
+        action_counts: Dict[str, int],
+        claimed_pairs: Set[Tuple[int, str]],
+        pending_checks: List[Dict]
     ):
-        """Record eligibility check in database.
+        """Check and claim each airdrop for one wallet, updating stats in place.
         
         Args:
             wallet: Wallet database record
-            airdrop_name: Airdrop name
-            airdrop_config: Airdrop configuration
-            is_eligible: Whether wallet is eligible
-            reason: Eligibility check reason/message
+            airdrops_to_check: Airdrop configurations by name
+            check_only: Only check eligibility, don't claim
+            stats: Statistics dictionary to update
+            action_counts: Successful action counts by type for this wallet
+            claimed_pairs: (wallet_id, airdrop_name) pairs already claimed
+            pending_checks: Buffer of check results not yet written
         """
-        with get_db_session() as session:
-            # Check for existing record
-            claim = session.query(AirdropClaim).filter(
-                AirdropClaim.wallet_id == wallet.id,
-                AirdropClaim.airdrop_name == airdrop_name
-            ).first()
+        # Apply anti-detection skip logic
+        if self.anti_detection.should_skip_action(wallet.address):
+            stats['skipped'] += 1
+            return
+        
+        # Check each airdrop
+        for airdrop_name, airdrop_config in airdrops_to_check.items():
+            stats['total_checks'] += 1
             
-            if not claim:
-                claim = AirdropClaim(
-                    wallet_id=wallet.id,
-                    airdrop_name=airdrop_name,
-                    chain=airdrop_config.get('chain', wallet.chain),
-                    status='eligible' if is_eligible else 'ineligible',
-                    checked_at=datetime.now(timezone.utc)
+            # Check if already claimed
+            if (wallet.id, airdrop_name) in claimed_pairs:
+                logger.debug(
+                    "already_claimed",
+                    wallet=wallet.address[:10],
+                    airdrop=airdrop_name
                 )
-                session.add(claim)
-            else:
-                claim.status = 'eligible' if is_eligible else 'ineligible'
-                claim.checked_at = datetime.now(timezone.utc)
+                continue
+            
+            # Check eligibility
+            is_eligible, reason, metadata = await self.eligibility_checker.check_eligibility(
+                wallet, airdrop_config, action_counts
+            )
             
+            # Record check result
+            check = {
+                'wallet_id': wallet.id,
+                'airdrop_name': airdrop_name,
+                'chain': airdrop_config.get('chain', wallet.chain),
+                'status': 'eligible' if is_eligible else 'ineligible',
+                'checked_at': datetime.now(timezone.utc)
+            }
             if not is_eligible and reason:
-                claim.error_message = reason
+                check['error_message'] = reason
+            pending_checks.append(check)
             
-            session.commit()
+            if not is_eligible:
+                stats['ineligible'] += 1
+                continue
+            
+            stats['eligible'] += 1
+            
+            # Claim if not check-only mode
+            if not check_only:
+                # Add human-like delay
+                delay = self.anti_detection.get_jittered_delay(
+                    base_delay=random.uniform(2.0, 5.0)
+                )
+                await asyncio.sleep(delay)
+                
+                # Respect the per-endpoint request rate
+                await self.rate_limiter.acquire(
+                    airdrop_config.get('chain', wallet.chain),
+                    airdrop_config.get('eligibility_api')
+                    or airdrop_config.get('claim_contract')
+                )
+                
+                # Write buffered checks first so the claim result lands on top
+                self._record_checks(pending_checks)
+                
+                # Execute claim
+                success = await self._execute_claim(
+                    wallet, airdrop_name, airdrop_config, metadata
+                )
+                
+                if success:
+                    stats['claimed'] += 1
+                else:
+                    stats['failed'] += 1
+    
+    def _get_claimed_pairs(
+        self,
+        wallet_ids: List[int],
+        airdrop_names: List[str],
+        batch_size: int = 500
+    ) -> Set[Tuple[int, str]]:
+        """Find which (wallet, airdrop) pairs have already been claimed.
+        
+        Args:
+            wallet_ids: Wallet IDs being processed
+            airdrop_names: Airdrops being checked
+            batch_size: Wallet IDs per IN (...) query
+            
+        Returns:
+            Set of (wallet_id, airdrop_name) pairs with a successful claim
+        """
+        claimed = set()
+        
+        for start in range(0, len(wallet_ids), batch_size):
+            batch = wallet_ids[start:start + batch_size]
+            
+            with get_db_session() as session:
+                rows = session.execute(
+                    select(AirdropClaim.wallet_id, AirdropClaim.airdrop_name).where(
+                        AirdropClaim.wallet_id.in_(batch),
+                        AirdropClaim.airdrop_name.in_(airdrop_names),
+                        AirdropClaim.status == 'claimed'
+                    )
+                ).all()
+            
+            claimed.update((wallet_id, airdrop_name) for wallet_id, airdrop_name in rows)
+        
+        return claimed
+    
+    def _record_checks(self, checks: List[Dict], batch_size: int = 500):
+        """Record eligibility check results in database.
+        
+        Existing claim rows are updated and missing ones inserted, all in a
+        single transaction. The list is emptied once written.
+        
+        Args:
+            checks: Check results with wallet_id, airdrop_name, chain, status,
+                checked_at and optionally error_message
+            batch_size: Wallet IDs per IN (...) query when finding existing rows
+        """
+        if not checks:
+            return
+        
+        wallet_ids = list({check['wallet_id'] for check in checks})
+        airdrop_names = list({check['airdrop_name'] for check in checks})
+        
+        with get_db_session() as session:
+            # Find rows that already exist for these (wallet, airdrop) pairs
+            existing = {}
+            for start in range(0, len(wallet_ids), batch_size):
+                rows = session.execute(
+                    select(
+                        AirdropClaim.id,
+                        AirdropClaim.wallet_id,
+                        AirdropClaim.airdrop_name
+                    ).where(
+                        AirdropClaim.wallet_id.in_(wallet_ids[start:start + batch_size]),
+                        AirdropClaim.airdrop_name.in_(airdrop_names)
+                    )
+                ).all()
+                for claim_id, wallet_id, airdrop_name in rows:
+                    existing.setdefault((wallet_id, airdrop_name), claim_id)
+            
+            inserts = []
+            updates = []
+            for check in checks:
+                claim_id = existing.get((check['wallet_id'], check['airdrop_name']))
+                if claim_id is None:
+                    inserts.append(check)
+                else:
+                    update_row = {
+                        'id': claim_id,
+                        'status': check['status'],
+                        'checked_at': check['checked_at']
+                    }
+                    if 'error_message' in check:
+                        update_row['error_message'] = check['error_message']
+                    updates.append(update_row)
+            
+            session.bulk_insert_mappings(AirdropClaim, inserts)
+            session.bulk_update_mappings(AirdropClaim, updates)
+        
+        checks.clear()
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
     async def _execute_claim(
         self,
         wallet: Wallet,
@@ -540,21 +804,31 @@ class AirdropClaimer:
                 return False
             
             # Execute claim based on method
-            if claim_method == 'merkle':
-                tx_hash = await self._claim_merkle(
-                    wallet, airdrop_config, metadata, private_key
-                )
-            elif claim_method == 'api':
-                tx_hash = await self._claim_api(
-                    wallet, airdrop_config, metadata, private_key
-                )
-            elif claim_method == 'direct':
-                tx_hash = await self._claim_direct(
-                    wallet, airdrop_config, metadata, private_key
-                )
-            else:
+            claim_handler = self._claim_handlers.get(claim_method)
+            if claim_handler is None:
                 raise ValueError(f"Unknown claim method: {claim_method}")
             
+            for attempt in range(CLAIM_ATTEMPTS):
+                try:
+                    tx_hash = await claim_handler(
+                        wallet, airdrop_config, metadata, private_key
+                    )
+                    break
+                except TRANSIENT_CLAIM_ERRORS as e:
+                    if attempt == CLAIM_ATTEMPTS - 1:
+                        raise
+                    
+                    delay = backoff_with_jitter(attempt, base=2.0, cap=10.0)
+                    logger.warning(
+                        "claim_retrying",
+                        wallet=wallet.address[:10],
+                        airdrop=airdrop_name,
+                        attempt=attempt + 1,
+                        delay=delay,
+                        error=str(e)
+                    )
+                    await asyncio.sleep(delay)
+            
             # Record successful claim
             self._record_claim_success(
                 wallet, airdrop_name, airdrop_config, tx_hash, metadata
@@ -604,10 +878,7 @@ class AirdropClaimer:
         )
         
         # Simulated transaction hash
-        tx_hash = '0x' + ''.join([random.choice('0123456789abcdef') for _ in range(64)])
-        
-        # Simulate network delay
-        await asyncio.sleep(random.uniform(1.0, 3.0))
+        tx_hash = '0x' + secrets.token_hex(32)
         
         return tx_hash
     
@@ -642,10 +913,7 @@ class AirdropClaimer:
         )
         
         # Simulated claim ID
-        claim_id = '0x' + ''.join([random.choice('0123456789abcdef') for _ in range(64)])
-        
-        # Simulate API delay
-        await asyncio.sleep(random.uniform(0.5, 2.0))
+        claim_id = '0x' + secrets.token_hex(32)
         
         return claim_id
     
@@ -682,10 +950,7 @@ class AirdropClaimer:
         )
         
         # Simulated transaction hash
-        tx_hash = '0x' + ''.join([random.choice('0123456789abcdef') for _ in range(64)])
-        
-        # Simulate network delay
-        await asyncio.sleep(random.uniform(1.0, 3.0))
+        tx_hash = '0x' + secrets.token_hex(32)
         
         return tx_hash
     
@@ -706,22 +971,28 @@ class AirdropClaimer:
             tx_hash: Transaction hash
             metadata: Claim metadata
         """
+        values = {
+            'status': 'claimed',
+            'tx_hash': tx_hash,
+            'claimed_at': datetime.now(timezone.utc),
+            'error_message': None
+        }
+        if metadata and 'amount' in metadata:
+            values['amount_claimed'] = metadata['amount']
+        
         with get_db_session() as session:
-            claim = session.query(AirdropClaim).filter(
-                AirdropClaim.wallet_id == wallet.id,
-                AirdropClaim.airdrop_name == airdrop_name
-            ).first()
-            
-            if claim:
-                claim.status = 'claimed'
-                claim.tx_hash = tx_hash
-                claim.claimed_at = datetime.now(timezone.utc)
-                
-                if metadata and 'amount' in metadata:
-                    claim.amount_claimed = metadata['amount']
-                
-                claim.error_message = None
-            else:
+            # The eligibility check normally created the row already, so
+            # update it in place and only insert when nothing matched
+            updated = session.execute(
+                update(AirdropClaim)
+                .where(
+                    AirdropClaim.wallet_id == wallet.id,
+                    AirdropClaim.airdrop_name == airdrop_name
+                )
+                .values(**values)
+            ).rowcount
+            
+            if not updated:
                 claim = AirdropClaim(
                     wallet_id=wallet.id,
                     airdrop_name=airdrop_name,
@@ -756,15 +1027,16 @@ class AirdropClaimer:
             error: Error message
         """
         with get_db_session() as session:
-            claim = session.query(AirdropClaim).filter(
-                AirdropClaim.wallet_id == wallet.id,
-                AirdropClaim.airdrop_name == airdrop_name
-            ).first()
-            
-            if claim:
-                claim.status = 'failed'
-                claim.error_message = error
-            else:
+            updated = session.execute(
+                update(AirdropClaim)
+                .where(
+                    AirdropClaim.wallet_id == wallet.id,
+                    AirdropClaim.airdrop_name == airdrop_name
+                )
+                .values(status='failed', error_message=error)
+            ).rowcount
+            
+            if not updated:
                 claim = AirdropClaim(
                     wallet_id=wallet.id,
                     airdrop_name=airdrop_name,
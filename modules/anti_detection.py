@@ -244,15 +244,16 @@ class AntiDetection:
             Shuffled list of actions
         """
         if shard_id is not None:
-            # Use shard and date for deterministic shuffle
-            seed = shard_id + int(datetime.utcnow().strftime('%Y%m%d'))
-            random.seed(seed)
+            # Use shard and date for deterministic shuffle, on a private
+            # generator so the module-level one is never reseeded
+            today = datetime.utcnow().date()
+            seed = shard_id + today.year * 10000 + today.month * 100 + today.day
+            rng = random.Random(seed)
+        else:
+            rng = random
         
         shuffled = actions.copy()
-        random.shuffle(shuffled)
-        
-        # Reset random seed
-        random.seed()
+        rng.shuffle(shuffled)
         
         return shuffled
     
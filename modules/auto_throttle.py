@@ -18,13 +18,17 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 
 import os
 import time
-from typing import Dict, Optional, Tuple
+import heapq
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import deque
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Status codes that indicate rate limiting or server overload
+THROTTLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 class AutoThrottle:
     """
@@ -77,12 +81,18 @@ class AutoThrottle:
             os.getenv('AUTO_THROTTLE_MAX_PAUSE', str(max_pause_duration_seconds))
         )
         
-        # Tracking structures
-        # identifier -> deque of (timestamp, is_error)
-        self.request_history: Dict[str, deque] = {}
+        # Tracking structures, kept as parallel deques per identifier
+        # identifier -> deque of request times (time.monotonic())
+        self.request_times: Dict[str, deque] = {}
+        # identifier -> deque of is_error flags, aligned with request_times
+        self.request_errors: Dict[str, deque] = {}
+        # identifier -> number of True entries in request_errors
+        self.error_counts: Dict[str, int] = {}
         
-        # identifier -> (pause_until, current_pause_duration)
-        self.paused_identifiers: Dict[str, Tuple[datetime, int]] = {}
+        # identifier -> (pause_until as time.monotonic(), current_pause_duration)
+        self.paused_identifiers: Dict[str, Tuple[float, int]] = {}
+        # Min-heap of (pause_until, identifier) used to expire pauses in bulk
+        self._pause_heap: List[Tuple[float, str]] = []
         
         # Statistics
         self.throttle_events = 0
@@ -110,23 +120,33 @@ class AutoThrottle:
             is_error: Whether the request resulted in an error
             status_code: Optional HTTP status code
         """
-        now = datetime.utcnow()
+        now = time.monotonic()
+        self._sweep_expired_pauses(now)
         
         # Initialize history if needed
-        if identifier not in self.request_history:
-            self.request_history[identifier] = deque()
+        if identifier not in self.request_times:
+            self.request_times[identifier] = deque()
+            self.request_errors[identifier] = deque()
+            self.error_counts[identifier] = 0
         
-        # Record this request
-        self.request_history[identifier].append((now, is_error, status_code))
+        times = self.request_times[identifier]
+        errors = self.request_errors[identifier]
         
-        # Clean old entries outside window
-        cutoff = now - timedelta(seconds=self.error_window_seconds)
-        history = self.request_history[identifier]
-        while history and history[0][0] < cutoff:
-            history.popleft()
+        # Record this request
+        times.append(now)
+        errors.append(is_error)
+        if is_error:
+            self.error_counts[identifier] += 1
+        
+        # Clean old entries outside window, keeping the error count in step
+        cutoff = now - self.error_window_seconds
+        while times and times[0] < cutoff:
+            times.popleft()
+            if errors.popleft():
+                self.error_counts[identifier] -= 1
         
         # Check if we should throttle based on error status codes
-        if status_code in [429, 500, 502, 503, 504]:
+        if status_code in THROTTLE_STATUS_CODES:
             self._check_and_throttle(identifier)
     
     def _check_and_throttle(self, identifier: str):
@@ -136,15 +156,11 @@ class AutoThrottle:
         Args:
             identifier: Identifier to check
         """
-        history = self.request_history.get(identifier, deque())
+        error_rate = self.get_error_rate(identifier)
         
-        if len(history) < self.min_samples:
+        if error_rate is None:
             return  # Not enough samples yet
         
-        # Calculate error rate
-        error_count = sum(1 for _, is_error, _ in history if is_error)
-        error_rate = error_count / len(history)
-        
         if error_rate >= self.error_threshold:
             # Throttle this identifier
             self._apply_throttle(identifier, error_rate)
@@ -157,7 +173,7 @@ class AutoThrottle:
             identifier: Identifier to throttle
             error_rate: Current error rate
         """
-        now = datetime.utcnow()
+        now = time.monotonic()
         
         # Determine pause duration
         if identifier in self.paused_identifiers:
@@ -170,8 +186,9 @@ class AutoThrottle:
         else:
             new_duration = self.pause_duration_seconds
         
-        pause_until = now + timedelta(seconds=new_duration)
+        pause_until = now + new_duration
         self.paused_identifiers[identifier] = (pause_until, new_duration)
+        heapq.heappush(self._pause_heap, (pause_until, identifier))
         
         self.throttle_events += 1
         self.total_pauses += 1
@@ -181,7 +198,7 @@ class AutoThrottle:
             identifier=identifier,
             error_rate=round(error_rate, 3),
             pause_duration_seconds=new_duration,
-            pause_until=pause_until.isoformat()
+            pause_until=(datetime.utcnow() + timedelta(seconds=new_duration)).isoformat()
         )
     
     def is_paused(self, identifier: str) -> Tuple[bool, Optional[int]]:
@@ -198,7 +215,7 @@ class AutoThrottle:
             return False, None
         
         pause_until, _ = self.paused_identifiers[identifier]
-        now = datetime.utcnow()
+        now = time.monotonic()
         
         if now >= pause_until:
             # Pause expired, remove it
@@ -206,9 +223,30 @@ class AutoThrottle:
             logger.info("Auto-throttle pause expired", identifier=identifier)
             return False, None
         
-        seconds_remaining = int((pause_until - now).total_seconds())
+        seconds_remaining = int(pause_until - now)
         return True, seconds_remaining
     
+    def _sweep_expired_pauses(self, now: Optional[float] = None):
+        """
+        Drop every pause whose deadline has passed.
+        
+        Pauses are otherwise only expired when their identifier is next
+        checked, so idle identifiers would linger and inflate active_pauses.
+        
+        Args:
+            now: Current time.monotonic() value (read if omitted)
+        """
+        now = time.monotonic() if now is None else now
+        
+        while self._pause_heap and self._pause_heap[0][0] <= now:
+            pause_until, identifier = heapq.heappop(self._pause_heap)
+            
+            # Skip heap entries superseded by a later pause or a reset
+            current = self.paused_identifiers.get(identifier)
+            if current and current[0] == pause_until:
+                del self.paused_identifiers[identifier]
+                logger.info("Auto-throttle pause expired", identifier=identifier)
+    
     def get_error_rate(self, identifier: str) -> Optional[float]:
         """
         Get current error rate for an identifier.
@@ -219,13 +257,12 @@ class AutoThrottle:
         Returns:
             Error rate (0.0-1.0) or None if insufficient data
         """
-        history = self.request_history.get(identifier, deque())
+        sample_count = len(self.request_times.get(identifier, ()))
         
-        if len(history) < self.min_samples:
+        if sample_count < self.min_samples:
             return None
         
-        error_count = sum(1 for _, is_error, _ in history if is_error)
-        return error_count / len(history)
+        return self.error_counts[identifier] / sample_count
     
     def reset_throttle(self, identifier: str):
         """
@@ -238,8 +275,10 @@ class AutoThrottle:
             del self.paused_identifiers[identifier]
             logger.info("Manually reset throttle", identifier=identifier)
         
-        if identifier in self.request_history:
-            self.request_history[identifier].clear()
+        if identifier in self.request_times:
+            self.request_times[identifier].clear()
+            self.request_errors[identifier].clear()
+            self.error_counts[identifier] = 0
     
     def get_slowdown_factor(self, identifier: str) -> float:
         """
@@ -269,15 +308,13 @@ class AutoThrottle:
     
     def get_stats(self) -> Dict:
         """Get auto-throttle statistics."""
+        self._sweep_expired_pauses()
         active_pauses = len(self.paused_identifiers)
-        monitored_identifiers = len(self.request_history)
+        monitored_identifiers = len(self.request_times)
         
         # Calculate average error rate across all identifiers
-        total_requests = 0
-        total_errors = 0
-        for history in self.request_history.values():
-            total_requests += len(history)
-            total_errors += sum(1 for _, is_error, _ in history if is_error)
+        total_requests = sum(len(times) for times in self.request_times.values())
+        total_errors = sum(self.error_counts.values())
         
         avg_error_rate = total_errors / total_requests if total_requests > 0 else 0.0
         
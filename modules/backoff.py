@@ -0,0 +1,40 @@
+"""
+Retry back-off helpers.
+
+This module computes capped exponential back-off delays with jitter so that
+many workers retrying at once spread out instead of hitting an endpoint in
+the same instant.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BYNNΛI - AirdropFarm
+Sophisticated multi-chain airdrop farming automation
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Author: BYNNΛI
+Project: AirdropFarm
+License: MIT
+Repository: https://github.com/BYNNAI/airdrop-farming-bot
+"""
+
+import random
+
+
+def backoff_with_jitter(
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 60.0,
+    jitter: float = 0.3
+) -> float:
+    """Get the delay before retry number attempt.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay for the first retry in seconds
+        cap: Upper bound for the un-jittered delay in seconds
+        jitter: Fraction of the delay to randomize in either direction
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(cap, base * 2 ** attempt)
+    return random.uniform(delay * (1 - jitter), delay * (1 + jitter))
@@ -21,10 +21,12 @@ import time
 import asyncio
 import random
 import hashlib
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import aiohttp
 import yaml
+from sqlalchemy import insert, select, update
 from tenacity import (
     retry, stop_after_attempt, wait_exponential,
     retry_if_exception_type, before_sleep_log
@@ -33,11 +35,12 @@ import logging
 
 from utils.database import (
     Wallet, FaucetRequest, FaucetCooldown,
-    get_db_session, db_manager
+    get_db_session, db_manager, run_db
 )
 from utils.logging_config import get_logger, log_faucet_request
 from modules.captcha_broker import CaptchaBroker
 from modules.anti_detection import AntiDetection
+from modules.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
@@ -109,7 +112,9 @@ class FaucetWorker:
         config: FaucetConfig,
         captcha_broker: CaptchaBroker,
         proxy_list: Optional[List[str]] = None,
-        anti_detection: Optional[AntiDetection] = None
+        anti_detection: Optional[AntiDetection] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         """Initialize faucet worker.
         
@@ -118,6 +123,8 @@ class FaucetWorker:
             captcha_broker: Captcha solving broker
             proxy_list: Optional list of proxy URLs
             anti_detection: Optional anti-detection coordinator
+            rate_limiter: Optional per-(chain, host) request rate limiter
+            session: Optional shared HTTP session (one is opened per request if omitted)
         """
         self.config = config
         self.captcha_broker = captcha_broker
@@ -126,6 +133,12 @@ class FaucetWorker:
         
         # Initialize anti-detection if not provided
         self.anti_detection = anti_detection or AntiDetection(proxy_list=proxy_list)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.session = session
+        
+        # (faucet, address, chain) -> cooldown_until (None = no cooldown record).
+        # This worker writes every cooldown it creates, so entries stay current
+        self.cooldown_cache: Dict[Tuple[str, str, str], Optional[datetime]] = {}
         
         # Worker settings
         self.timeout = int(os.getenv("FAUCET_REQUEST_TIMEOUT", "30"))
@@ -182,21 +195,63 @@ class FaucetWorker:
         Returns:
             Tuple of (is_in_cooldown, cooldown_expires_at)
         """
-        with get_db_session() as session:
-            cooldown = session.query(FaucetCooldown).filter_by(
-                faucet_name=faucet_name,
-                wallet_address=wallet_address,
-                chain=chain
-            ).first()
+        key = (faucet_name, wallet_address, chain)
+        if key not in self.cooldown_cache:
+            with get_db_session() as session:
+                cooldown = session.query(FaucetCooldown).filter_by(
+                    faucet_name=faucet_name,
+                    wallet_address=wallet_address,
+                    chain=chain
+                ).first()
+                
+                self.cooldown_cache[key] = cooldown.cooldown_until if cooldown else None
+        
+        cooldown_until = self.cooldown_cache[key]
+        if cooldown_until and cooldown_until > datetime.utcnow():
+            return True, cooldown_until
+        
+        return False, None
+    
+    def prefetch_cooldowns(
+        self,
+        faucet_names: List[str],
+        wallet_addresses: List[str],
+        chain: str,
+        batch_size: int = 500
+    ):
+        """Load cooldowns for many wallets on one chain into the cache.
+        
+        Replaces one _check_cooldown query per (faucet, wallet) with one
+        query per batch of addresses.
+        
+        Args:
+            faucet_names: Faucets configured for the chain
+            wallet_addresses: Wallet addresses about to be funded
+            chain: Chain identifier
+            batch_size: Addresses per IN (...) query
+        """
+        for start in range(0, len(wallet_addresses), batch_size):
+            batch = wallet_addresses[start:start + batch_size]
             
-            if not cooldown:
-                return False, None
+            # Pairs without a row have no cooldown
+            for faucet_name in faucet_names:
+                for address in batch:
+                    self.cooldown_cache[(faucet_name, address, chain)] = None
             
-            now = datetime.utcnow()
-            if cooldown.cooldown_until > now:
-                return True, cooldown.cooldown_until
+            with get_db_session() as session:
+                rows = session.execute(
+                    select(
+                        FaucetCooldown.faucet_name,
+                        FaucetCooldown.wallet_address,
+                        FaucetCooldown.cooldown_until
+                    ).where(
+                        FaucetCooldown.chain == chain,
+                        FaucetCooldown.wallet_address.in_(batch)
+                    )
+                ).all()
             
-            return False, None
+            for faucet_name, address, cooldown_until in rows:
+                self.cooldown_cache[(faucet_name, address, chain)] = cooldown_until
     
     def _update_cooldown(
         self,
@@ -247,6 +302,52 @@ class FaucetWorker:
                 session.add(cooldown)
             
             session.commit()
+        
+        self.cooldown_cache[(faucet_name, wallet_address, chain)] = cooldown_until
+    
+    def _get_request_status(self, idempotency_key: str) -> Optional[str]:
+        """Look up the status of an existing request by idempotency key.
+        
+        Args:
+            idempotency_key: Idempotency key of the request
+            
+        Returns:
+            Request status, or None if no request exists
+        """
+        with get_db_session() as session:
+            return session.execute(
+                select(FaucetRequest.status)
+                .where(FaucetRequest.idempotency_key == idempotency_key)
+                .limit(1)
+            ).scalar_one_or_none()
+    
+    def _create_request(self, **values) -> int:
+        """Insert a faucet request record.
+        
+        Args:
+            **values: Column values for the new record
+            
+        Returns:
+            ID of the inserted record
+        """
+        with get_db_session() as session:
+            return session.execute(
+                insert(FaucetRequest).values(**values).returning(FaucetRequest.id)
+            ).scalar_one()
+    
+    def _update_request(self, request_id: int, **values):
+        """Update a faucet request record in place.
+        
+        Args:
+            request_id: ID of the record to update
+            **values: Column values to set
+        """
+        with get_db_session() as session:
+            session.execute(
+                update(FaucetRequest)
+                .where(FaucetRequest.id == request_id)
+                .values(**values)
+            )
     
     async def claim_from_faucet(
         self,
@@ -265,29 +366,25 @@ class FaucetWorker:
             True if successful, False otherwise
         """
         faucet_name = faucet_config['name']
+        now = datetime.utcnow()
         
         # Generate idempotency key
         idempotency_key = self._generate_idempotency_key(
             faucet_name,
             wallet.address,
             chain,
-            datetime.utcnow()
+            now
         )
         
         # Check for existing request today
-        with get_db_session() as session:
-            existing = session.query(FaucetRequest).filter_by(
-                idempotency_key=idempotency_key
-            ).first()
-            
-            if existing and existing.status == 'success':
-                logger.info(
-                    "faucet_already_claimed_today",
-                    wallet=wallet.address,
-                    chain=chain,
-                    faucet=faucet_name
-                )
-                return True
+        if await run_db(self._get_request_status, idempotency_key) == 'success':
+            logger.info(
+                "faucet_already_claimed_today",
+                wallet=wallet.address,
+                chain=chain,
+                faucet=faucet_name
+            )
+            return True
         
         # Check cooldown first (more efficient to skip if in cooldown)
         cooldown_hours = faucet_config.get('cooldown_hours', 24)
@@ -295,7 +392,8 @@ class FaucetWorker:
             cooldown_hours * 3600
         ) / 3600.0
         
-        in_cooldown, cooldown_until = self._check_cooldown(
+        in_cooldown, cooldown_until = await run_db(
+            self._check_cooldown,
             faucet_name,
             wallet.address,
             chain,
@@ -322,20 +420,17 @@ class FaucetWorker:
             )
             return False
         
-        # Create request record
-        with get_db_session() as session:
-            request = FaucetRequest(
-                wallet_id=wallet.id,
-                chain=chain,
-                faucet_name=faucet_name,
-                idempotency_key=idempotency_key,
-                status='in_progress',
-                amount_requested=faucet_config.get('amount', '0'),
-                requested_at=datetime.utcnow()
-            )
-            session.add(request)
-            session.commit()
-            request_id = request.id
+        # Create request record, getting its id back from the same statement
+        request_id = await run_db(
+            self._create_request,
+            wallet_id=wallet.id,
+            chain=chain,
+            faucet_name=faucet_name,
+            idempotency_key=idempotency_key,
+            status='in_progress',
+            amount_requested=faucet_config.get('amount', '0'),
+            requested_at=now
+        )
         
         # Attempt to claim
         try:
@@ -361,20 +456,23 @@ class FaucetWorker:
             success = await self._make_faucet_request(
                 wallet.address,
                 faucet_config,
-                captcha_token
+                captcha_token,
+                chain
             )
             
             if success:
                 # Update request as successful
-                with get_db_session() as session:
-                    request = session.query(FaucetRequest).get(request_id)
-                    request.status = 'success'
-                    request.completed_at = datetime.utcnow()
-                    request.captcha_solved = captcha_token is not None
-                    session.commit()
+                await run_db(
+                    self._update_request,
+                    request_id,
+                    status='success',
+                    completed_at=datetime.utcnow(),
+                    captcha_solved=captcha_token is not None
+                )
                 
                 # Update cooldown
-                self._update_cooldown(
+                await run_db(
+                    self._update_cooldown,
                     faucet_name,
                     wallet.address,
                     chain,
@@ -396,13 +494,14 @@ class FaucetWorker:
         
         except Exception as e:
             # Update request as failed
-            with get_db_session() as session:
-                request = session.query(FaucetRequest).get(request_id)
-                request.status = 'failed'
-                request.last_error = str(e)
-                request.error_class = type(e).__name__
-                request.attempts += 1
-                session.commit()
+            await run_db(
+                self._update_request,
+                request_id,
+                status='failed',
+                last_error=str(e),
+                error_class=type(e).__name__,
+                attempts=FaucetRequest.attempts + 1
+            )
             
             log_faucet_request(
                 logger,
@@ -419,7 +518,8 @@ class FaucetWorker:
         self,
         address: str,
         faucet_config: Dict,
-        captcha_token: Optional[str]
+        captcha_token: Optional[str],
+        chain: str = ''
     ) -> bool:
         """Make HTTP request to faucet endpoint.
         
@@ -427,6 +527,7 @@ class FaucetWorker:
             address: Wallet address to fund
             faucet_config: Faucet configuration
             captcha_token: Optional captcha token
+            chain: Chain identifier (used for rate limiting)
             
         Returns:
             True if successful
@@ -512,47 +613,92 @@ class FaucetWorker:
             jittered_delay = self.anti_detection.get_jittered_delay(base_delay)
             await asyncio.sleep(jittered_delay)
         
-        # Make request
+        # Respect the per-endpoint request rate
+        await self.rate_limiter.acquire(chain, url)
+        
+        # Make request over the shared session when one was provided
         timeout = aiohttp.ClientTimeout(total=self.timeout)
+        if self.session is not None:
+            return await self._send_faucet_request(
+                self.session, method, url, payload, payload_format,
+                proxy, headers, timeout, address
+            )
+        
         async with aiohttp.ClientSession(timeout=timeout) as session:
-            try:
-                if method == 'POST':
-                    # Choose content type based on payload format
-                    if payload_format == 'form':
-                        # Send as form data
-                        async with session.post(
-                            url,
-                            data=payload,
-                            proxy=proxy,
-                            headers=headers
-                        ) as response:
-                            return await self._handle_faucet_response(response, url, address)
-                    else:
-                        # Send as JSON (default)
-                        async with session.post(
-                            url,
-                            json=payload,
-                            proxy=proxy,
-                            headers=headers
-                        ) as response:
-                            return await self._handle_faucet_response(response, url, address)
+            return await self._send_faucet_request(
+                session, method, url, payload, payload_format,
+                proxy, headers, timeout, address
+            )
+    
+    async def _send_faucet_request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        payload: Dict,
+        payload_format: str,
+        proxy: Optional[str],
+        headers: Dict,
+        timeout: aiohttp.ClientTimeout,
+        address: str
+    ) -> bool:
+        """Send a prepared faucet request over session.
+        
+        Args:
+            session: HTTP session to send on
+            method: HTTP method (POST or GET)
+            url: Faucet endpoint URL
+            payload: Request payload
+            payload_format: 'json' or 'form' for POST bodies
+            proxy: Optional proxy URL
+            headers: Request headers
+            timeout: Per-request timeout
+            address: Wallet address being funded
+            
+        Returns:
+            True if successful
+        """
+        try:
+            if method == 'POST':
+                # Choose content type based on payload format
+                if payload_format == 'form':
+                    # Send as form data
+                    async with session.post(
+                        url,
+                        data=payload,
+                        proxy=proxy,
+                        timeout=timeout,
+                        headers=headers
+                    ) as response:
+                        return await self._handle_faucet_response(response, url, address)
                 else:
-                    # GET request
-                    async with session.get(
+                    # Send as JSON (default)
+                    async with session.post(
                         url,
-                        params=payload,
+                        json=payload,
                         proxy=proxy,
+                        timeout=timeout,
                         headers=headers
                     ) as response:
                         return await self._handle_faucet_response(response, url, address)
-            
-            except aiohttp.ClientError as e:
-                logger.warning(
-                    "faucet_network_error",
-                    url=url,
-                    error=str(e)
-                )
-                return False
+            else:
+                # GET request
+                async with session.get(
+                    url,
+                    params=payload,
+                    proxy=proxy,
+                    timeout=timeout,
+                    headers=headers
+                ) as response:
+                    return await self._handle_faucet_response(response, url, address)
+        
+        except aiohttp.ClientError as e:
+            logger.warning(
+                "faucet_network_error",
+                url=url,
+                error=str(e)
+            )
+            return False
     
     async def _handle_faucet_response(
         self,
@@ -642,13 +788,17 @@ class FaucetOrchestrator:
     def __init__(
         self,
         config_path: str = None,
-        concurrency: int = None
+        concurrency: int = None,
+        max_rate: Optional[float] = None,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         """Initialize faucet orchestrator.
         
         Args:
             config_path: Path to faucets.yaml
             concurrency: Max concurrent workers
+            max_rate: Max requests per second per (chain, faucet host)
+            session: Optional shared HTTP session reused by all requests
         """
         self.config = FaucetConfig(config_path)
         self.captcha_broker = CaptchaBroker()
@@ -661,14 +811,26 @@ class FaucetOrchestrator:
             os.getenv("FAUCET_WORKER_CONCURRENCY", "5")
         )
         
+        # One limit for the whole orchestrator, so concurrent fund_wallets
+        # calls (e.g. one per chain) share it instead of each getting their own
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        
         # Initialize anti-detection coordinator
         self.anti_detection = AntiDetection(proxy_list=self.proxy_list)
+        self.rate_limiter = RateLimiter(max_rate=max_rate)
+        
+        # (chain, address) -> lock, so the same wallet is never claimed for
+        # twice at once on one chain; different chains touch separate
+        # idempotency and cooldown rows and may run in parallel
+        self.address_locks: Dict[Tuple[str, str], asyncio.Lock] = defaultdict(asyncio.Lock)
         
         self.worker = FaucetWorker(
             self.config,
             self.captcha_broker,
             self.proxy_list,
-            self.anti_detection
+            self.anti_detection,
+            self.rate_limiter,
+            session
         )
     
     async def fund_wallet(
@@ -697,25 +859,26 @@ class FaucetOrchestrator:
             
             # Try each faucet until one succeeds
             success = False
-            for faucet_config in faucets:
-                try:
-                    success = await self.worker.claim_from_faucet(
-                        wallet,
-                        faucet_config,
-                        chain
-                    )
-                    
-                    if success:
-                        break
-                    
-                except Exception as e:
-                    logger.error(
-                        "faucet_claim_error",
-                        wallet=wallet.address,
-                        chain=chain,
-                        faucet=faucet_config['name'],
-                        error=str(e)
-                    )
+            async with self.address_locks[(chain, wallet.address)]:
+                for faucet_config in faucets:
+                    try:
+                        success = await self.worker.claim_from_faucet(
+                            wallet,
+                            faucet_config,
+                            chain
+                        )
+                        
+                        if success:
+                            break
+                        
+                    except Exception as e:
+                        logger.error(
+                            "faucet_claim_error",
+                            wallet=wallet.address,
+                            chain=chain,
+                            faucet=faucet_config['name'],
+                            error=str(e)
+                        )
             
             results[chain] = success
         
@@ -739,6 +902,16 @@ class FaucetOrchestrator:
         """
         chains = chains or self.config.get_all_chains()
         
+        # Load every cooldown for these wallets up front
+        addresses = [wallet.address for wallet in wallets]
+        for chain in chains:
+            await run_db(
+                self.worker.prefetch_cooldowns,
+                [faucet['name'] for faucet in self.config.get_chain_faucets(chain)],
+                addresses,
+                chain
+            )
+        
         # Group wallets by shard if staggering enabled
         if shard_stagger:
             shards = {}
@@ -765,19 +938,18 @@ class FaucetOrchestrator:
                 wallet_count=len(shard_wallets)
             )
             
-            # Create tasks for this shard with semaphore for concurrency
-            semaphore = asyncio.Semaphore(self.concurrency)
-            
             async def fund_with_semaphore(wallet):
-                async with semaphore:
+                async with self.semaphore:
                     return await self.fund_wallet(wallet, chains)
             
             tasks = [fund_with_semaphore(w) for w in shard_wallets]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Aggregate results
-            for result in results:
-                if isinstance(result, Exception):
+            # Aggregate results as each wallet finishes rather than after the
+            # slowest one, so finished results don't pile up in memory
+            for future in asyncio.as_completed(tasks):
+                try:
+                    result = await future
+                except Exception:
                     stats['failed'] += 1
                     continue
                 
@@ -13,6 +13,7 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
 import os
+import asyncio
 from typing import Dict, Any, Optional
 from web3 import Web3
 from eth_account import Account
@@ -161,8 +162,10 @@ class BridgeIntegration:
         signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
-        # Wait for confirmation
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Wait for confirmation off the event loop (polls for up to 120s)
+        receipt = await asyncio.to_thread(
+            self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+        )
         
         logger.info(
             "bridge_completed",
@@ -244,8 +247,10 @@ class BridgeIntegration:
         signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
-        # Wait for confirmation
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Wait for confirmation off the event loop (polls for up to 120s)
+        receipt = await asyncio.to_thread(
+            self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+        )
         
         logger.info(
             "bridge_completed",
@@ -17,6 +17,7 @@ from typing import Dict, Any, Optional
 import aiohttp
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
+from solana.rpc.types import TokenAccountOpts
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
@@ -30,14 +31,22 @@ logger = get_logger(__name__)
 class JupiterIntegration:
     """Integration with Jupiter aggregator for Solana swaps."""
     
-    def __init__(self, rpc_url: str, use_devnet: bool = True):
+    def __init__(
+        self,
+        rpc_url: str,
+        use_devnet: bool = True,
+        client: Optional[AsyncClient] = None
+    ):
         """Initialize Jupiter integration.
         
         Args:
             rpc_url: Solana RPC endpoint URL
             use_devnet: Whether to use devnet API (default: True for testing)
+            client: Optional AsyncClient to share with other integrations
         """
-        self.client = AsyncClient(rpc_url)
+        # Only a client created here is ours to close
+        self._owns_client = client is None
+        self.client = client or AsyncClient(rpc_url)
         self.rpc_url = rpc_url
         
         # Jupiter API endpoints
@@ -182,19 +191,19 @@ class JupiterIntegration:
         """
         pubkey = Pubkey.from_string(wallet_pubkey)
         
-        # Get token accounts
-        result = await self.client.get_token_accounts_by_owner(
+        # jsonParsed token accounts already carry their balances, so one
+        # RPC call replaces the account lookup plus a balance lookup
+        result = await self.client.get_token_accounts_by_owner_json_parsed(
             pubkey,
-            {"mint": Pubkey.from_string(token_mint)}
+            TokenAccountOpts(mint=Pubkey.from_string(token_mint))
         )
         
         if not result.value:
             return 0
         
         # Get balance from first token account
-        token_account = result.value[0].pubkey
-        balance_result = await self.client.get_token_account_balance(token_account)
-        balance = int(balance_result.value.amount)
+        token_info = result.value[0].account.data.parsed['info']
+        balance = int(token_info['tokenAmount']['amount'])
         
         logger.debug(
             "token_balance_checked",
@@ -206,5 +215,6 @@ class JupiterIntegration:
         return balance
     
     async def close(self):
-        """Close the RPC client connection."""
-        await self.client.close()
+        """Close the RPC client connection, unless it was passed in by the caller."""
+        if self._owns_client:
+            await self.client.close()
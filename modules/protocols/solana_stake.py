@@ -13,7 +13,8 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
 import os
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
 from solders.keypair import Keypair
@@ -30,17 +31,29 @@ logger = get_logger(__name__)
 # Stake Program ID
 STAKE_PROGRAM_ID = Pubkey.from_string("Stake11111111111111111111111111111111111111")
 
+# The vote account set only changes per epoch (~2 days), so reuse it for a while
+VALIDATOR_TTL = float(os.getenv('VALIDATOR_TTL', '43200'))
+
+# Validators charging this commission (percent) or more are not offered
+MAX_VALIDATOR_COMMISSION = int(os.getenv('MAX_VALIDATOR_COMMISSION', '10'))
+
+# RPC URL -> (fetched_at, validator list)
+_validator_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
 
 class SolanaStakeIntegration:
     """Integration with Solana native staking."""
     
-    def __init__(self, rpc_url: str):
+    def __init__(self, rpc_url: str, client: Optional[AsyncClient] = None):
         """Initialize Solana staking integration.
         
         Args:
             rpc_url: Solana RPC endpoint URL
+            client: Optional AsyncClient to share with other integrations
         """
-        self.client = AsyncClient(rpc_url)
+        # Only a client created here is ours to close
+        self._owns_client = client is None
+        self.client = client or AsyncClient(rpc_url)
         self.rpc_url = rpc_url
         
         logger.info(
@@ -160,10 +173,14 @@ class SolanaStakeIntegration:
             limit: Maximum number of validators to return
             
         Returns:
-            List of validator vote accounts
+            List of validator vote accounts with commission below
+            MAX_VALIDATOR_COMMISSION
         """
+        cached = _validator_cache.get(self.rpc_url)
+        if cached and time.monotonic() - cached[0] < VALIDATOR_TTL:
+            return cached[1][:limit]
+        
         result = await self.client.get_vote_accounts()
-        validators = result.value.current[:limit]
         
         validator_list = [
             {
@@ -171,16 +188,20 @@ class SolanaStakeIntegration:
                 'commission': v.commission,
                 'activated_stake': v.activated_stake
             }
-            for v in validators
+            for v in result.value.current
+            if v.commission < MAX_VALIDATOR_COMMISSION
         ]
+        _validator_cache[self.rpc_url] = (time.monotonic(), validator_list)
         
         logger.debug(
             "validators_fetched",
-            count=len(validator_list)
+            count=len(validator_list),
+            total=len(result.value.current)
         )
         
-        return validator_list
+        return validator_list[:limit]
     
     async def close(self):
-        """Close the RPC client connection."""
-        await self.client.close()
+        """Close the RPC client connection, unless it was passed in by the caller."""
+        if self._owns_client:
+            await self.client.close()
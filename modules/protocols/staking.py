@@ -13,6 +13,7 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
 import os
+import asyncio
 from typing import Dict, Any, Optional
 from web3 import Web3
 from eth_account import Account
@@ -120,8 +121,10 @@ class StakingIntegration:
         signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
-        # Wait for confirmation
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Wait for confirmation off the event loop (polls for up to 120s)
+        receipt = await asyncio.to_thread(
+            self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+        )
         
         logger.info(
             "stake_completed",
@@ -149,7 +152,9 @@ class StakingIntegration:
             Staked balance in wei
         """
         wallet = Web3.to_checksum_address(wallet_address)
-        balance = self.contract.functions.balanceOf(wallet).call()
+        balance = await asyncio.to_thread(
+            self.contract.functions.balanceOf(wallet).call
+        )
         
         logger.debug(
             "staked_balance_checked",
@@ -165,7 +170,9 @@ class StakingIntegration:
         Returns:
             Total staked amount in wei
         """
-        total = self.contract.functions.getTotalPooledEther().call()
+        total = await asyncio.to_thread(
+            self.contract.functions.getTotalPooledEther().call
+        )
         
         logger.debug(
             "total_staked_checked",
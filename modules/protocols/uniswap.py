@@ -13,6 +13,8 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
 import os
+import asyncio
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from web3 import Web3
 from web3.contract import Contract
@@ -105,6 +107,16 @@ ERC20_ABI = [
 ]
 
 
+# EIP-1559 priority fee (2 gwei), precomputed to skip a Decimal conversion per tx
+MAX_PRIORITY_FEE_WEI = 2 * 10**9
+
+
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address, caching the Keccak result per input string."""
+    return Web3.to_checksum_address(address)
+
+
 class UniswapIntegration:
     """Integration with Uniswap V2 Router for token swaps."""
     
@@ -117,13 +129,17 @@ class UniswapIntegration:
             chain: Chain identifier
         """
         self.web3 = web3
-        self.router_address = Web3.to_checksum_address(router_address)
+        self.router_address = _checksum(router_address)
         self.chain = chain
         self.router = self.web3.eth.contract(
             address=self.router_address,
             abi=UNISWAP_V2_ROUTER_ABI
         )
         self.slippage_tolerance = float(os.getenv('SLIPPAGE_TOLERANCE', '0.03'))
+        self.weth_address = os.getenv(f'WETH_{chain.upper()}')
+        
+        # Checksummed token address -> ERC20 contract instance
+        self._token_contracts: Dict[str, Contract] = {}
         
         logger.info(
             "uniswap_initialized",
@@ -141,10 +157,12 @@ class UniswapIntegration:
         Returns:
             Contract instance
         """
-        return self.web3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=ERC20_ABI
-        )
+        token_address = _checksum(token_address)
+        contract = self._token_contracts.get(token_address)
+        if contract is None:
+            contract = self.web3.eth.contract(address=token_address, abi=ERC20_ABI)
+            self._token_contracts[token_address] = contract
+        return contract
     
     def _build_transaction_params(self, wallet: str, nonce: int, gas_limit: int) -> Dict[str, Any]:
         """Build transaction parameters with EIP-1559 support.
@@ -164,7 +182,7 @@ class UniswapIntegration:
             
             if base_fee > 0:
                 # Chain supports EIP-1559
-                max_priority_fee = Web3.to_wei(2, 'gwei')
+                max_priority_fee = MAX_PRIORITY_FEE_WEI
                 max_fee = (base_fee * 2) + max_priority_fee
                 
                 return {
@@ -210,7 +228,7 @@ class UniswapIntegration:
             Transaction hash
         """
         token = self.get_token_contract(token_address)
-        wallet = Web3.to_checksum_address(wallet_address)
+        wallet = _checksum(wallet_address)
         
         # Check current allowance
         allowance = token.functions.allowance(wallet, self.router_address).call()
@@ -238,8 +256,10 @@ class UniswapIntegration:
         signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
-        # Wait for confirmation
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Wait for confirmation off the event loop (polls for up to 120s)
+        receipt = await asyncio.to_thread(
+            self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+        )
         
         logger.info(
             "token_approved",
@@ -272,9 +292,9 @@ class UniswapIntegration:
         Returns:
             Result dictionary with tx_hash and amounts
         """
-        wallet = Web3.to_checksum_address(wallet_address)
-        from_token = Web3.to_checksum_address(from_token)
-        to_token = Web3.to_checksum_address(to_token)
+        wallet = _checksum(wallet_address)
+        from_token = _checksum(from_token)
+        to_token = _checksum(to_token)
         
         # Approve token spending first
         await self.approve_token(from_token, wallet_address, private_key, amount_in)
@@ -303,8 +323,10 @@ class UniswapIntegration:
         signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
-        # Wait for confirmation
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Wait for confirmation off the event loop (polls for up to 120s)
+        receipt = await asyncio.to_thread(
+            self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+        )
         
         logger.info(
             "swap_completed",
@@ -343,14 +365,13 @@ class UniswapIntegration:
         Returns:
             Result dictionary with tx_hash and amounts
         """
-        wallet = Web3.to_checksum_address(wallet_address)
-        to_token = Web3.to_checksum_address(to_token)
+        wallet = _checksum(wallet_address)
+        to_token = _checksum(to_token)
         
         # WETH address - must be configured for the chain
-        weth_address = os.getenv(f'WETH_{self.chain.upper()}')
-        if not weth_address:
+        if not self.weth_address:
             raise ValueError(f"WETH address not configured for chain {self.chain}. Set WETH_{self.chain.upper()} in environment.")
-        weth = Web3.to_checksum_address(weth_address)
+        weth = _checksum(self.weth_address)
         
         # Get expected output amount
         path = [weth, to_token]
@@ -376,8 +397,10 @@ class UniswapIntegration:
         signed_tx = self.web3.eth.account.sign_transaction(tx, private_key)
         tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
-        # Wait for confirmation
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        # Wait for confirmation off the event loop (polls for up to 120s)
+        receipt = await asyncio.to_thread(
+            self.web3.eth.wait_for_transaction_receipt, tx_hash, timeout=120
+        )
         
         logger.info(
             "eth_swap_completed",
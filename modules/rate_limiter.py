@@ -0,0 +1,86 @@
+"""
+Per-endpoint request rate limiting for async workers.
+
+This module spaces outgoing requests so that concurrent workers hitting the
+same endpoint stay under a configured rate instead of bursting into 429
+responses and retry storms.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BYNNΛI - AirdropFarm
+Sophisticated multi-chain airdrop farming automation
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Author: BYNNΛI
+Project: AirdropFarm
+License: MIT
+Repository: https://github.com/BYNNAI/airdrop-farming-bot
+"""
+
+import os
+import time
+import asyncio
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Async rate limiter keyed by (chain, endpoint host).
+
+    Each key gets its own schedule of evenly spaced request slots, so
+    requests to unrelated hosts never wait on each other.
+    """
+
+    def __init__(self, max_rate: Optional[float] = None, period: float = 1.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_rate: Max requests per period for each key (None or 0 disables)
+            period: Period length in seconds
+        """
+        if max_rate is None:
+            max_rate = float(os.getenv('MAX_REQUEST_RATE', '0'))
+
+        self.max_rate = max_rate
+        self.period = period
+
+        # (chain, host) -> monotonic time of the next free request slot
+        self.next_slot: Dict[Tuple[str, str], float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether rate limiting is active."""
+        return bool(self.max_rate and self.max_rate > 0)
+
+    async def acquire(self, chain: str, url: Optional[str]):
+        """
+        Wait until a request to url on chain may be sent.
+
+        Args:
+            chain: Chain identifier
+            url: Endpoint URL (its host is used as part of the key)
+        """
+        if not self.enabled or not url:
+            return
+
+        key = (chain, urlparse(url).netloc or url)
+        interval = self.period / self.max_rate
+
+        # Reserve the slot before awaiting so concurrent callers queue up
+        now = time.monotonic()
+        slot = max(now, self.next_slot.get(key, now))
+        self.next_slot[key] = slot + interval
+
+        delay = slot - now
+        if delay > 0:
+            logger.debug(
+                "rate_limit_wait",
+                chain=chain,
+                host=key[1],
+                delay_seconds=round(delay, 3)
+            )
+            await asyncio.sleep(delay)
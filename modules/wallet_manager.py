@@ -18,20 +18,30 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 
 import os
 import base64
+import hmac
 import hashlib
-from typing import List, Optional, Dict, Tuple
+import secrets
+from collections import OrderedDict
+from typing import Callable, List, Optional, Dict, Tuple
 from cryptography.fernet import Fernet
+from sqlalchemy import Row, func, insert, select
 from mnemonic import Mnemonic
 from eth_account import Account
-from eth_account.hdaccount import HDPath
+from eth_account.hdaccount import seed_from_mnemonic
+from eth_account.hdaccount.deterministic import Node, SoftNode, derive_child_key
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from utils.database import Wallet, db_manager, get_db_session
 from utils.logging_config import get_logger
-import base58
 
 logger = get_logger(__name__)
 
+# Rows per bulk INSERT when persisting generated wallets
+WALLET_INSERT_BATCH_SIZE = 1000
+
+# Wallets derived between progress callback invocations
+PROGRESS_UPDATE_INTERVAL = 100
+
 
 class WalletManager:
     """Manage HD wallet generation, derivation, and encryption."""
@@ -67,6 +77,15 @@ class WalletManager:
         self.fernet = Fernet(self._derive_fernet_key(encryption_key))
         self.derivation_path = derivation_path
         
+        # BIP39 seed (PBKDF2, 2048 rounds) and the extended private key at
+        # derivation_path are derived lazily and reused for every index
+        self._bip39_seed: Optional[bytes] = None
+        self._evm_parent_key: Optional[Tuple[bytes, bytes]] = None
+        
+        # (address, chain) -> derived private key, least recently used first
+        self._pk_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._pk_cache_size = int(os.getenv("PK_CACHE_SIZE", "256"))
+        
         # Enable HD wallet derivation
         Account.enable_unaudited_hdwallet_features()
         
@@ -87,14 +106,19 @@ class WalletManager:
         """Generate a new BIP39 mnemonic seed phrase.
         
         Args:
-            word_count: Number of words (12 or 24)
+            word_count: Number of words (12, 15, 18, 21 or 24)
             
         Returns:
             Mnemonic seed phrase
+            
+        Raises:
+            ValueError: If word_count is not a valid BIP39 length
         """
-        strength = 128 if word_count == 12 else 256
-        mnemo = Mnemonic("english")
-        mnemonic = mnemo.generate(strength=strength)
+        if word_count not in (12, 15, 18, 21, 24):
+            raise ValueError(f"Invalid mnemonic word count: {word_count}")
+        
+        strength = word_count * 32 // 3
+        mnemonic = Mnemonic("english").to_mnemonic(secrets.token_bytes(strength // 8))
         
         logger.info(
             "mnemonic_generated",
@@ -126,6 +150,48 @@ class WalletManager:
         """
         return self.fernet.decrypt(encrypted_data.encode()).decode()
     
+    def _get_bip39_seed(self) -> bytes:
+        """Get the BIP39 seed for the configured mnemonic, computing it once.
+        
+        Returns:
+            64-byte BIP39 seed
+        """
+        if self._bip39_seed is None:
+            if not self.seed_mnemonic:
+                raise ValueError("No seed mnemonic available")
+            
+            # Validate mnemonic before derivation
+            mnemo = Mnemonic("english")
+            if not mnemo.check(self.seed_mnemonic):
+                raise ValueError("Invalid BIP39 mnemonic phrase")
+            
+            self._bip39_seed = seed_from_mnemonic(self.seed_mnemonic, "")
+        
+        return self._bip39_seed
+    
+    def _get_evm_parent_key(self) -> Tuple[bytes, bytes]:
+        """Get the (private key, chain code) at derivation_path, computing it once.
+        
+        Returns:
+            Tuple of (parent_key, parent_chain_code)
+            
+        Raises:
+            ValueError: If derivation_path is not an absolute path from "m/"
+        """
+        if self._evm_parent_key is None:
+            if not self.derivation_path.startswith("m/"):
+                raise ValueError(f"Invalid derivation path: {self.derivation_path}")
+            
+            master = hmac.new(b"Bitcoin seed", self._get_bip39_seed(), hashlib.sha512).digest()
+            key, chain_code = master[:32], master[32:]
+            
+            for node in self.derivation_path.split("/")[1:]:
+                key, chain_code = derive_child_key(key, chain_code, Node.decode(node))
+            
+            self._evm_parent_key = (key, chain_code)
+        
+        return self._evm_parent_key
+    
     def derive_evm_wallet(self, index: int) -> Tuple[str, str]:
         """Derive an EVM wallet from HD seed.
         
@@ -135,19 +201,10 @@ class WalletManager:
         Returns:
             Tuple of (address, private_key)
         """
-        if not self.seed_mnemonic:
-            raise ValueError("No seed mnemonic available")
-        
-        # Validate mnemonic before derivation
-        mnemo = Mnemonic("english")
-        if not mnemo.check(self.seed_mnemonic):
-            raise ValueError("Invalid BIP39 mnemonic phrase")
-        
-        # Derive account from mnemonic
-        account = Account.from_mnemonic(
-            self.seed_mnemonic,
-            account_path=f"{self.derivation_path}/{index}"
-        )
+        # Only the final non-hardened step is derived per index
+        parent_key, parent_chain_code = self._get_evm_parent_key()
+        private_key, _ = derive_child_key(parent_key, parent_chain_code, SoftNode(index))
+        account = Account.from_key(private_key)
         
         address = account.address
         private_key = account.key.hex()
@@ -176,7 +233,8 @@ class WalletManager:
         keypair = Keypair.from_seed(derived_seed[:32])
         
         address = str(keypair.pubkey())
-        private_key = base58.b58encode(bytes(keypair)).decode()
+        # solders encodes the 64-byte secret to base58 natively
+        private_key = str(keypair)
         
         return address, private_key
     
@@ -184,7 +242,8 @@ class WalletManager:
         self,
         count: int,
         chains: List[str] = None,
-        shard_size: int = 10
+        shard_size: int = 10,
+        progress_callback: Optional[Callable[[int], None]] = None
     ) -> Dict[str, List[str]]:
         """Generate multiple HD-derived wallets and store in database.
         
@@ -192,6 +251,8 @@ class WalletManager:
             count: Number of wallets to generate per chain
             chains: List of chains ('evm', 'solana', 'all')
             shard_size: Number of wallets per shard
+            progress_callback: Called with the number of newly processed
+                indices every PROGRESS_UPDATE_INTERVAL wallets
             
         Returns:
             Dictionary mapping chain to list of addresses
@@ -207,36 +268,44 @@ class WalletManager:
         
         with get_db_session() as session:
             for chain in chains:
+                if chain == 'evm':
+                    derive_wallet = self.derive_evm_wallet
+                elif chain == 'solana':
+                    derive_wallet = self.derive_solana_wallet
+                else:
+                    logger.warning(f"Unsupported chain: {chain}")
+                    generated[chain] = []
+                    # Still account for these indices so progress totals add up
+                    if progress_callback and count:
+                        progress_callback(count)
+                    continue
+                
                 addresses = []
+                new_rows = []
+                
+                # Fetch existing addresses once instead of probing per index
+                existing = {
+                    address for (address,) in session.query(Wallet.address).filter(
+                        Wallet.chain == chain
+                    )
+                }
                 
                 for i in range(count):
                     shard_id = i // shard_size
                     
                     try:
-                        if chain == 'evm':
-                            address, private_key = self.derive_evm_wallet(i)
-                        elif chain == 'solana':
-                            address, private_key = self.derive_solana_wallet(i)
-                        else:
-                            logger.warning(f"Unsupported chain: {chain}")
-                            continue
+                        address, private_key = derive_wallet(i)
                         
-                        # Check if wallet already exists
-                        existing = session.query(Wallet).filter_by(
-                            address=address,
-                            chain=chain
-                        ).first()
+                        addresses.append(address)
                         
-                        if not existing:
-                            wallet = Wallet(
-                                address=address,
-                                chain=chain,
-                                derivation_index=i,
-                                shard_id=shard_id,
-                                enabled=True
-                            )
-                            session.add(wallet)
-                            addresses.append(address)
+                        if address not in existing:
+                            new_rows.append({
+                                'address': address,
+                                'chain': chain,
+                                'derivation_index': i,
+                                'shard_id': shard_id,
+                                'enabled': True
+                            })
                             
                             logger.info(
                                 "wallet_generated",
@@ -246,7 +315,6 @@ class WalletManager:
                                 shard=shard_id
                             )
                         else:
-                            addresses.append(address)
                             logger.debug(
                                 "wallet_exists",
                                 chain=chain,
@@ -260,6 +328,19 @@ class WalletManager:
                             index=i,
                             error=str(e)
                         )
+                    
+                    if progress_callback and (i + 1) % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress_callback(PROGRESS_UPDATE_INTERVAL)
+                
+                if progress_callback and count % PROGRESS_UPDATE_INTERVAL:
+                    progress_callback(count % PROGRESS_UPDATE_INTERVAL)
+                
+                # Bulk insert new wallets in batches
+                for start in range(0, len(new_rows), WALLET_INSERT_BATCH_SIZE):
+                    session.execute(
+                        insert(Wallet),
+                        new_rows[start:start + WALLET_INSERT_BATCH_SIZE]
+                    )
                 
                 generated[chain] = addresses
                 session.commit()
@@ -272,11 +353,40 @@ class WalletManager:
         
         return generated
     
-    def get_wallets(
+    def _filter_wallets(
         self,
+        query,
         chain: Optional[str] = None,
         shard_id: Optional[int] = None,
         enabled_only: bool = True
+    ):
+        """Apply the common wallet filters to a query.
+        
+        Args:
+            query: SQLAlchemy query or select() over Wallet
+            chain: Filter by chain
+            shard_id: Filter by shard
+            enabled_only: Only include enabled wallets
+            
+        Returns:
+            Filtered query
+        """
+        if chain:
+            query = query.filter(Wallet.chain == chain)
+        if shard_id is not None:
+            query = query.filter(Wallet.shard_id == shard_id)
+        if enabled_only:
+            query = query.filter(Wallet.enabled == True)
+        
+        return query
+    
+    def get_wallets(
+        self,
+        chain: Optional[str] = None,
+        shard_id: Optional[int] = None,
+        enabled_only: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
     ) -> List[Wallet]:
         """Get wallets from database.
         
@@ -284,19 +394,21 @@ class WalletManager:
             chain: Filter by chain
             shard_id: Filter by shard
             enabled_only: Only return enabled wallets
+            limit: Maximum number of wallets to return
+            offset: Number of matching wallets to skip
             
         Returns:
             List of wallet records
         """
         with get_db_session() as session:
-            query = session.query(Wallet)
+            query = self._filter_wallets(
+                session.query(Wallet), chain, shard_id, enabled_only
+            ).order_by(Wallet.id)
             
-            if chain:
-                query = query.filter(Wallet.chain == chain)
-            if shard_id is not None:
-                query = query.filter(Wallet.shard_id == shard_id)
-            if enabled_only:
-                query = query.filter(Wallet.enabled == True)
+            if limit is not None:
+                query = query.limit(limit)
+            if offset:
+                query = query.offset(offset)
             
             wallets = query.all()
             
@@ -305,10 +417,68 @@ class WalletManager:
             
             return wallets
     
+    def list_wallets_summary(
+        self,
+        chain: Optional[str] = None,
+        shard_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        enabled_only: bool = True
+    ) -> List[Row]:
+        """Get display columns for wallets without hydrating ORM objects.
+        
+        Args:
+            chain: Filter by chain
+            shard_id: Filter by shard
+            limit: Maximum number of rows to return
+            enabled_only: Only return enabled wallets
+            
+        Returns:
+            Rows of (id, address, chain, shard_id, derivation_index)
+        """
+        with get_db_session() as session:
+            stmt = self._filter_wallets(
+                select(
+                    Wallet.id,
+                    Wallet.address,
+                    Wallet.chain,
+                    Wallet.shard_id,
+                    Wallet.derivation_index
+                ),
+                chain, shard_id, enabled_only
+            ).order_by(Wallet.id)
+            
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            
+            return session.execute(stmt).all()
+    
+    def count_wallets(
+        self,
+        chain: Optional[str] = None,
+        shard_id: Optional[int] = None,
+        enabled_only: bool = True
+    ) -> int:
+        """Count wallets matching the same filters as get_wallets.
+        
+        Args:
+            chain: Filter by chain
+            shard_id: Filter by shard
+            enabled_only: Only count enabled wallets
+            
+        Returns:
+            Number of matching wallets
+        """
+        with get_db_session() as session:
+            return self._filter_wallets(
+                session.query(func.count(Wallet.id)), chain, shard_id, enabled_only
+            ).scalar()
+    
     def get_private_key(self, address: str, chain: str) -> Optional[str]:
         """Get private key for a wallet address.
         
-        IMPORTANT: Private keys are derived on-demand from seed, never stored.
+        IMPORTANT: Private keys are derived on-demand from seed, never stored
+        in the database. Recently used keys are kept in memory, bounded by
+        PK_CACHE_SIZE, so repeated lookups skip the query and derivation.
         
         Args:
             address: Wallet address
@@ -317,6 +487,11 @@ class WalletManager:
         Returns:
             Private key or None if not found
         """
+        key = (address, chain)
+        if key in self._pk_cache:
+            self._pk_cache.move_to_end(key)
+            return self._pk_cache[key]
+        
         with get_db_session() as session:
             wallet = session.query(Wallet).filter_by(
                 address=address,
@@ -334,8 +509,6 @@ class WalletManager:
                     _, private_key = self.derive_solana_wallet(wallet.derivation_index)
                 else:
                     return None
-                
-                return private_key
             except Exception as e:
                 logger.error(
                     "private_key_derivation_failed",
@@ -344,6 +517,13 @@ class WalletManager:
                     error=str(e)
                 )
                 return None
+        
+        if self._pk_cache_size > 0:
+            self._pk_cache[key] = private_key
+            if len(self._pk_cache) > self._pk_cache_size:
+                self._pk_cache.popitem(last=False)
+        
+        return private_key
     
     def update_nonce(self, address: str, chain: str, nonce: int):
         """Update wallet nonce (for EVM chains).
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+One-off migration that drops indexes superseded by newer composite indexes.
+
+idx_airdrop_wallet on airdrop_claims (wallet_id, airdrop_name) is a prefix of
+idx_airdrop_wallet_status (wallet_id, airdrop_name, status), so once the
+latter exists the old index only adds write cost. DatabaseManager.initialize()
+only ever creates missing indexes; run this script once to remove the old one
+from databases created before the composite index was added.
+
+Usage: python scripts/drop_legacy_indexes.py [--database-url URL]
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, inspect
+from utils.env import ensure_env_loaded
+
+# (table, superseded index, index that replaces it)
+LEGACY_INDEXES = [
+    ('airdrop_claims', 'idx_airdrop_wallet', 'idx_airdrop_wallet_status'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--database-url',
+        help='Database URL (defaults to DATABASE_URL or the bundled SQLite path)'
+    )
+    args = parser.parse_args()
+    
+    ensure_env_loaded()
+    database_url = args.database_url or os.getenv(
+        'DATABASE_URL',
+        'sqlite:///data/airdrop_farming.db'
+    )
+    engine = create_engine(database_url)
+    
+    with engine.begin() as conn:
+        op = Operations(MigrationContext.configure(conn))
+        inspector = inspect(conn)
+        
+        for table, old_index, new_index in LEGACY_INDEXES:
+            if not inspector.has_table(table):
+                print(f"Skipping {old_index}: table {table} does not exist")
+                continue
+            
+            existing = {index['name'] for index in inspector.get_indexes(table)}
+            if old_index not in existing:
+                print(f"Skipping {old_index}: already removed")
+                continue
+            if new_index not in existing:
+                # Keep the old index until its replacement has been created
+                print(f"Skipping {old_index}: {new_index} not created yet, start the bot once first")
+                continue
+            
+            op.drop_index(old_index, table_name=table)
+            print(f"Dropped {old_index} from {table}")
+
+
+if __name__ == '__main__':
+    main()
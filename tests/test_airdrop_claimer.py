@@ -40,6 +40,12 @@ def test_airdrop_registry():
     upcoming = registry.get_airdrops_by_status('upcoming')
     assert len(upcoming) >= 0, "Should get upcoming airdrops"
     
+    # Changes made through one registry must not leak into the next one,
+    # even though the parsed config is cached
+    example['min_actions'] = 100
+    fresh = AirdropRegistry().get_airdrop('example_testnet')
+    assert fresh['min_actions'] != 100, "Cached config should not be shared between registries"
+    
     print("✓ Airdrop registry tests passed")
 
 
@@ -276,6 +282,130 @@ def test_claim_recording():
     print("✓ Claim recording tests passed")
 
 
+def test_record_checks():
+    """Test batched recording of eligibility checks."""
+    print("\nTesting batched check recording...")
+    
+    # Initialize database
+    init_db("sqlite:///:memory:")
+    
+    test_seed = "test test test test test test test test test test test junk"
+    wallet_manager = WalletManager(
+        seed_mnemonic=test_seed,
+        encryption_key="test_encryption_key_32chars_min"
+    )
+    
+    wallet_manager.generate_wallets(count=3, chains=['evm'], shard_size=1)
+    
+    with get_db_session() as session:
+        for wallet in session.query(Wallet).all():
+            wallet.chain = 'ethereum_sepolia'
+        session.commit()
+    
+    wallets = wallet_manager.get_wallets(chain='ethereum_sepolia')
+    w1, w2, w3 = (wallet.id for wallet in wallets)
+    now = datetime.now(timezone.utc)
+    
+    # Two pairs already have rows from an earlier run
+    with get_db_session() as session:
+        session.add(AirdropClaim(
+            wallet_id=w1, airdrop_name='drop_a', chain='ethereum_sepolia',
+            status='eligible', checked_at=now
+        ))
+        session.add(AirdropClaim(
+            wallet_id=w2, airdrop_name='drop_a', chain='ethereum_sepolia',
+            status='ineligible', checked_at=now
+        ))
+        session.commit()
+    
+    def make_checks():
+        return [
+            # Existing rows
+            {'wallet_id': w1, 'airdrop_name': 'drop_a', 'chain': 'ethereum_sepolia',
+             'status': 'ineligible', 'checked_at': now, 'error_message': 'Missing required action: stake'},
+            {'wallet_id': w2, 'airdrop_name': 'drop_a', 'chain': 'ethereum_sepolia',
+             'status': 'eligible', 'checked_at': now},
+            # New rows
+            {'wallet_id': w1, 'airdrop_name': 'drop_b', 'chain': 'ethereum_sepolia',
+             'status': 'eligible', 'checked_at': now},
+            {'wallet_id': w3, 'airdrop_name': 'drop_a', 'chain': 'ethereum_sepolia',
+             'status': 'ineligible', 'checked_at': now, 'error_message': 'Insufficient actions: 0/3'},
+        ]
+    
+    claimer = AirdropClaimer(wallet_manager=wallet_manager)
+    
+    # A batch size of 1 makes every wallet its own IN (...) lookup
+    checks = make_checks()
+    claimer._record_checks(checks, batch_size=1)
+    assert checks == [], "Recorded checks should be cleared from the buffer"
+    
+    # Recording the same results again must update, not duplicate
+    claimer._record_checks(make_checks(), batch_size=1)
+    
+    with get_db_session() as session:
+        claims = session.query(AirdropClaim).all()
+        by_pair = {(c.wallet_id, c.airdrop_name): c for c in claims}
+        
+        assert len(claims) == 4, f"Should have one row per pair, found {len(claims)}"
+        assert len(by_pair) == len(claims), "No (wallet, airdrop) pair should be duplicated"
+        
+        for claim in claims:
+            if claim.status == 'ineligible':
+                assert claim.error_message, "Ineligible rows should carry the reason"
+            else:
+                assert claim.error_message is None, "Eligible rows should have no error_message"
+        
+        assert by_pair[(w1, 'drop_a')].status == 'ineligible'
+        assert by_pair[(w1, 'drop_a')].error_message == 'Missing required action: stake'
+        assert by_pair[(w2, 'drop_a')].status == 'eligible'
+        assert by_pair[(w1, 'drop_b')].status == 'eligible'
+        assert by_pair[(w3, 'drop_a')].error_message == 'Insufficient actions: 0/3'
+    
+    # Buffered checks are written before a claim, so the claim updates that row
+    airdrop_config = {
+        'name': 'Direct Test Airdrop',
+        'chain': 'ethereum_sepolia',
+        'claim_method': 'direct',
+        'min_actions': 0
+    }
+    wallet = wallets[2]
+    flushed_before_claim = []
+    
+    async def fake_execute_claim(wallet, airdrop_name, airdrop_config, metadata):
+        with get_db_session() as session:
+            flushed_before_claim.append(session.query(AirdropClaim).filter(
+                AirdropClaim.wallet_id == wallet.id,
+                AirdropClaim.airdrop_name == airdrop_name
+            ).count())
+        claimer._record_claim_success(wallet, airdrop_name, airdrop_config, '0x' + '1' * 64, None)
+        return True
+    
+    claimer._execute_claim = fake_execute_claim
+    claimer.anti_detection.should_skip_action = lambda address: False
+    claimer.anti_detection.get_jittered_delay = lambda base_delay: 0
+    
+    stats = {'total_checks': 0, 'eligible': 0, 'ineligible': 0, 'claimed': 0, 'failed': 0, 'skipped': 0}
+    pending_checks = []
+    asyncio.run(claimer._check_and_claim_wallet(
+        wallet, {'direct_test': airdrop_config}, False, stats, {}, set(), pending_checks
+    ))
+    
+    assert flushed_before_claim == [1], "Check row should be written before the claim executes"
+    assert pending_checks == [], "Buffer should be empty after the flush"
+    assert stats['claimed'] == 1
+    
+    with get_db_session() as session:
+        claims = session.query(AirdropClaim).filter(
+            AirdropClaim.wallet_id == wallet.id,
+            AirdropClaim.airdrop_name == 'direct_test'
+        ).all()
+        assert len(claims) == 1, "Claim should update the check row, not add another"
+        assert claims[0].status == 'claimed', "Claim result should land on top of the check"
+        assert claims[0].tx_hash is not None
+    
+    print("✓ Batched check recording tests passed")
+
+
 if __name__ == '__main__':
     configure_logging(log_level='WARNING')
     
@@ -288,6 +418,7 @@ if __name__ == '__main__':
         test_eligibility_checker()
         test_airdrop_claimer()
         test_claim_recording()
+        test_record_checks()
         
         print("\n" + "=" * 60)
         print("✓ All airdrop claimer tests passed!")
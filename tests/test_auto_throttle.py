@@ -0,0 +1,182 @@
+"""Tests for auto-throttle error tracking and pause expiry."""
+
+import os
+import sys
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logging_config import configure_logging
+from modules import auto_throttle
+from modules.auto_throttle import AutoThrottle
+
+
+class FakeClock:
+    """Stand-in for the time module so tests control time.monotonic()."""
+    
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+    
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _with_fake_clock(test):
+    """Run test(clock) with auto_throttle reading time from a FakeClock."""
+    clock = FakeClock()
+    real_time = auto_throttle.time
+    auto_throttle.time = clock
+    try:
+        test(clock)
+    finally:
+        auto_throttle.time = real_time
+
+
+def test_error_counts():
+    """Test running error counts against a brute-force count of the window."""
+    print("\nTesting auto-throttle error counts...")
+    
+    def run(clock):
+        throttle = AutoThrottle(error_window_seconds=60, min_samples=5)
+        window = throttle.error_window_seconds
+        rng = random.Random(1234)
+        identifiers = ['shard_0', 'shard_1', 'shard_2']
+        
+        # identifier -> every (time, is_error) recorded since the last reset
+        history = {identifier: [] for identifier in identifiers}
+        # identifier -> time of its last recorded request (when it was pruned)
+        last_seen = {}
+        
+        def expected_window(identifier):
+            if identifier not in last_seen:
+                return []
+            cutoff = last_seen[identifier] - window
+            return [is_error for t, is_error in history[identifier] if t >= cutoff]
+        
+        def check():
+            total_requests = 0
+            total_errors = 0
+            for identifier in identifiers:
+                entries = expected_window(identifier)
+                errors = sum(entries)
+                total_requests += len(entries)
+                total_errors += errors
+                
+                if len(entries) < throttle.min_samples:
+                    expected_rate = None
+                else:
+                    expected_rate = errors / len(entries)
+                assert throttle.get_error_rate(identifier) == expected_rate, \
+                    f"Error rate mismatch for {identifier}"
+            
+            expected_avg = total_errors / total_requests if total_requests > 0 else 0.0
+            stats = throttle.get_stats()
+            assert stats['avg_error_rate'] == round(expected_avg, 3), "avg_error_rate mismatch"
+        
+        for step in range(2000):
+            # Mostly short gaps, with occasional idle spells longer than the window
+            clock.now += rng.choices([0.5, 1, 2, 5, window + 1], weights=[30, 30, 20, 15, 5])[0]
+            identifier = rng.choice(identifiers)
+            
+            if rng.random() < 0.02:
+                throttle.reset_throttle(identifier)
+                history[identifier] = []
+            else:
+                is_error = rng.random() < 0.4
+                throttle.record_request(identifier, is_error)
+                history[identifier].append((clock.now, is_error))
+                last_seen[identifier] = clock.now
+            
+            check()
+            
+            for identifier in identifiers:
+                assert throttle.error_counts.get(identifier, 0) == sum(expected_window(identifier)), \
+                    f"error_counts drifted for {identifier} at step {step}"
+        
+        # Let everything age out, then a single success prunes the old errors
+        clock.now += window + 1
+        throttle.record_request('shard_0', False)
+        assert throttle.error_counts['shard_0'] == 0, "Aged-out errors should leave the count"
+        assert len(throttle.request_times['shard_0']) == 1, "Only the new request should remain"
+    
+    _with_fake_clock(run)
+    
+    print("✓ Error count tests passed")
+
+
+def test_pause_sweep():
+    """Test that sweeping skips heap entries superseded by a re-pause or reset."""
+    print("\nTesting auto-throttle pause sweep...")
+    
+    def run(clock):
+        throttle = AutoThrottle(pause_duration_seconds=600, backoff_multiplier=2.0)
+        start = clock.now
+        first = throttle.pause_duration_seconds
+        second = int(first * throttle.backoff_multiplier)
+        
+        # Re-pausing leaves the first deadline in the heap
+        throttle._apply_throttle('repaused', 0.5)
+        clock.now = start + 100
+        throttle._apply_throttle('repaused', 0.5)
+        assert len(throttle._pause_heap) == 2, "Both deadlines should be queued"
+        
+        # A reset leaves its deadline in the heap too, as does a fresh pause after it
+        throttle._apply_throttle('reset', 0.5)
+        throttle.reset_throttle('reset')
+        clock.now = start + 200
+        throttle._apply_throttle('reset', 0.5)
+        assert throttle.paused_identifiers['reset'][1] == first, "Pause after reset should not back off"
+        
+        # A reset with no later pause
+        throttle._apply_throttle('released', 0.5)
+        throttle.reset_throttle('released')
+        
+        # The first 'repaused' deadline and the pre-reset 'reset' deadline have
+        # passed; neither should end the pause that replaced it
+        clock.now = start + first + 150
+        stats = throttle.get_stats()
+        assert 'repaused' in throttle.paused_identifiers, "Superseded deadline should not end the re-pause"
+        assert 'reset' in throttle.paused_identifiers, "Stale deadline should not end the pause after reset"
+        assert 'released' not in throttle.paused_identifiers
+        assert stats['active_pauses'] == 2, "Only the two live pauses should count"
+        assert throttle.is_paused('repaused')[0], "Re-paused identifier should still be paused"
+        
+        # The fresh 'reset' pause expires first, alongside the stale 'released' entry
+        clock.now = start + 200 + first
+        assert throttle.get_stats()['active_pauses'] == 1
+        assert 'reset' not in throttle.paused_identifiers, "Pause after reset should expire on schedule"
+        assert 'repaused' in throttle.paused_identifiers
+        
+        # Then the backed-off pause
+        clock.now = start + 100 + second
+        assert throttle.get_stats()['active_pauses'] == 0, "All pauses should have expired"
+        assert not throttle._pause_heap, "Every heap entry should have been consumed"
+    
+    _with_fake_clock(run)
+    
+    print("✓ Pause sweep tests passed")
+
+
+if __name__ == '__main__':
+    configure_logging(log_level='WARNING')
+    
+    print("=" * 60)
+    print("Running Auto-Throttle Tests")
+    print("=" * 60)
+    
+    try:
+        test_error_counts()
+        test_pause_sweep()
+        
+        print("\n" + "=" * 60)
+        print("✓ All auto-throttle tests passed!")
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
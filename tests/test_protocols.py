@@ -3,7 +3,7 @@
 import os
 import sys
 import asyncio
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,6 +12,8 @@ from web3 import Web3
 from modules.protocols.uniswap import UniswapIntegration
 from modules.protocols.staking import StakingIntegration
 from modules.protocols.bridges import BridgeIntegration
+from modules.protocols import solana_stake
+from modules.protocols.solana_stake import SolanaStakeIntegration
 
 
 def test_uniswap_initialization():
@@ -149,6 +151,36 @@ def test_token_contract_creation():
     mock_web3.eth.contract.assert_called()
 
 
+def test_solana_validators_filtered_and_cached():
+    """Test that high-commission validators are dropped before caching."""
+    rpc_url = "http://validators.test"
+    vote_accounts = [
+        Mock(vote_pubkey="Vote111", commission=0, activated_stake=300),
+        Mock(vote_pubkey="Vote222", commission=solana_stake.MAX_VALIDATOR_COMMISSION, activated_stake=200),
+        Mock(vote_pubkey="Vote333", commission=100, activated_stake=100),
+        Mock(vote_pubkey="Vote444", commission=solana_stake.MAX_VALIDATOR_COMMISSION - 1, activated_stake=50),
+    ]
+    mock_client = Mock()
+    mock_client.get_vote_accounts = AsyncMock(return_value=Mock(value=Mock(current=vote_accounts)))
+    
+    stake = SolanaStakeIntegration(rpc_url, client=mock_client)
+    solana_stake._validator_cache.pop(rpc_url, None)
+    try:
+        validators = asyncio.run(stake.get_validators())
+        assert [v['vote_pubkey'] for v in validators] == ["Vote111", "Vote444"]
+        
+        # Served from the cache, which holds only the filtered list
+        validators = asyncio.run(stake.get_validators(limit=1))
+        assert [v['vote_pubkey'] for v in validators] == ["Vote111"]
+        assert all(
+            v['commission'] < solana_stake.MAX_VALIDATOR_COMMISSION
+            for v in solana_stake._validator_cache[rpc_url][1]
+        )
+        mock_client.get_vote_accounts.assert_awaited_once()
+    finally:
+        solana_stake._validator_cache.pop(rpc_url, None)
+
+
 def run_all_tests():
     """Run all protocol tests."""
     print("=" * 60)
@@ -168,6 +200,9 @@ def run_all_tests():
         test_token_contract_creation()
         print("✓ Token contract creation test passed")
         
+        test_solana_validators_filtered_and_cached()
+        print("✓ Solana validator filter test passed")
+        
         # Run async tests
         asyncio.run(test_uniswap_approve_token())
         print("✓ Uniswap approve token test passed")
@@ -0,0 +1,123 @@
+"""Tests for per-endpoint request rate limiting."""
+
+import os
+import sys
+import time
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logging_config import configure_logging
+from modules.rate_limiter import RateLimiter
+
+
+async def _acquire_times(limiter, requests):
+    """Acquire every (chain, url) concurrently and return the release offsets."""
+    start = time.monotonic()
+    
+    async def acquire(chain, url):
+        await limiter.acquire(chain, url)
+        return time.monotonic() - start
+    
+    return await asyncio.gather(*[acquire(chain, url) for chain, url in requests])
+
+
+def test_slot_spacing():
+    """Test that requests to one (chain, host) are spaced by period/max_rate."""
+    print("\nTesting rate limiter slot spacing...")
+    
+    limiter = RateLimiter(max_rate=20, period=1.0)
+    interval = limiter.period / limiter.max_rate
+    
+    # Different paths on the same host share a key
+    requests = [
+        ('ethereum_sepolia', f'https://faucet.example.com/claim/{i}')
+        for i in range(5)
+    ]
+    times = sorted(asyncio.run(_acquire_times(limiter, requests)))
+    
+    assert times[0] < interval / 2, "First request should not wait"
+    for earlier, later in zip(times, times[1:]):
+        assert later - earlier >= interval * 0.9, "Requests should be spaced by period/max_rate"
+    assert times[-1] >= interval * 4 * 0.9, "Fifth request should wait four intervals"
+    
+    # The same host on another chain is a separate key
+    limiter = RateLimiter(max_rate=20, period=1.0)
+    requests = [
+        ('ethereum_sepolia', 'https://rpc.example.com'),
+        ('polygon_amoy', 'https://rpc.example.com')
+    ]
+    times = asyncio.run(_acquire_times(limiter, requests))
+    assert max(times) < interval / 2, "Same host on different chains should not wait"
+    
+    print("✓ Slot spacing tests passed")
+
+
+def test_independent_hosts():
+    """Test that requests to different hosts never wait on each other."""
+    print("\nTesting rate limiter host isolation...")
+    
+    limiter = RateLimiter(max_rate=10, period=1.0)
+    interval = limiter.period / limiter.max_rate
+    
+    requests = [
+        ('ethereum_sepolia', f'https://faucet{i}.example.com/claim')
+        for i in range(5)
+    ]
+    times = asyncio.run(_acquire_times(limiter, requests))
+    assert max(times) < interval / 2, "Different hosts should not wait on each other"
+    
+    # A busy host does not delay a quiet one
+    requests = [('ethereum_sepolia', 'https://busy.example.com')] * 4
+    requests.append(('ethereum_sepolia', 'https://quiet.example.com'))
+    times = asyncio.run(_acquire_times(limiter, requests))
+    assert times[-1] < interval / 2, "Quiet host should not queue behind a busy one"
+    
+    print("✓ Host isolation tests passed")
+
+
+def test_disabled_limiter():
+    """Test that max_rate of 0 or None disables limiting."""
+    print("\nTesting disabled rate limiter...")
+    
+    previous = os.environ.pop('MAX_REQUEST_RATE', None)
+    try:
+        for max_rate in (0, None):
+            limiter = RateLimiter(max_rate=max_rate)
+            assert not limiter.enabled, f"max_rate={max_rate} should disable limiting"
+            
+            requests = [('ethereum_sepolia', 'https://faucet.example.com')] * 20
+            times = asyncio.run(_acquire_times(limiter, requests))
+            assert max(times) < 0.05, f"max_rate={max_rate} should never wait"
+            assert not limiter.next_slot, "Disabled limiter should not track slots"
+    finally:
+        if previous is not None:
+            os.environ['MAX_REQUEST_RATE'] = previous
+    
+    print("✓ Disabled limiter tests passed")
+
+
+if __name__ == '__main__':
+    configure_logging(log_level='WARNING')
+    
+    print("=" * 60)
+    print("Running Rate Limiter Tests")
+    print("=" * 60)
+    
+    try:
+        test_slot_spacing()
+        test_independent_hosts()
+        test_disabled_limiter()
+        
+        print("\n" + "=" * 60)
+        print("✓ All rate limiter tests passed!")
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,126 @@
+"""Tests for HD wallet derivation and mnemonic generation."""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eth_account import Account
+from mnemonic import Mnemonic
+from utils.database import init_db
+from utils.logging_config import configure_logging
+from modules.wallet_manager import WalletManager
+
+TEST_SEED = "test test test test test test test test test test test junk"
+
+
+def test_evm_derivation():
+    """Test that cached-parent EVM derivation matches full-path derivation."""
+    print("\nTesting EVM wallet derivation...")
+    
+    wallet_manager = WalletManager(
+        seed_mnemonic=TEST_SEED,
+        encryption_key="test_encryption_key_32chars_min"
+    )
+    
+    # Well-known first account for this seed
+    address, _ = wallet_manager.derive_evm_wallet(0)
+    assert address == "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266", "Index 0 should match the standard test account"
+    
+    Account.enable_unaudited_hdwallet_features()
+    for index in (0, 1, 2, 7, 100, 2**31 - 1):
+        address, private_key = wallet_manager.derive_evm_wallet(index)
+        expected = Account.from_mnemonic(
+            TEST_SEED,
+            account_path=f"{wallet_manager.derivation_path}/{index}"
+        )
+        assert address == expected.address, f"Address mismatch at index {index}"
+        assert private_key == expected.key.hex(), f"Private key mismatch at index {index}"
+    
+    # Relative paths are rejected, as with eth_account's HDPath
+    bad_manager = WalletManager(
+        seed_mnemonic=TEST_SEED,
+        encryption_key="test_encryption_key_32chars_min",
+        derivation_path="44'/60'/0'/0"
+    )
+    try:
+        bad_manager.derive_evm_wallet(0)
+        assert False, "Should reject derivation path without m/ prefix"
+    except ValueError:
+        pass
+    
+    print("✓ EVM derivation tests passed")
+
+
+def test_generate_mnemonic():
+    """Test mnemonic generation for every BIP39 length."""
+    print("\nTesting mnemonic generation...")
+    
+    wallet_manager = WalletManager(encryption_key="test_encryption_key_32chars_min")
+    mnemo = Mnemonic("english")
+    
+    for word_count in (12, 15, 18, 21, 24):
+        for _ in range(20):
+            mnemonic = wallet_manager.generate_mnemonic(word_count)
+            assert len(mnemonic.split()) == word_count, f"Should generate {word_count} words"
+            assert mnemo.check(mnemonic), f"Generated {word_count}-word mnemonic should pass checksum"
+    
+    try:
+        wallet_manager.generate_mnemonic(13)
+        assert False, "Should reject invalid word count"
+    except ValueError:
+        pass
+    
+    print("✓ Mnemonic generation tests passed")
+
+
+def test_generate_wallets_progress():
+    """Test that progress covers every chain, including unsupported ones."""
+    print("\nTesting wallet generation progress...")
+    
+    init_db("sqlite:///:memory:")
+    
+    wallet_manager = WalletManager(
+        seed_mnemonic=TEST_SEED,
+        encryption_key="test_encryption_key_32chars_min"
+    )
+    
+    advances = []
+    generated = wallet_manager.generate_wallets(
+        count=150,
+        chains=['evm', 'unknown_chain'],
+        shard_size=10,
+        progress_callback=advances.append
+    )
+    
+    assert len(generated['evm']) == 150, "Should derive every EVM wallet"
+    assert generated['unknown_chain'] == [], "Unsupported chain should yield no wallets"
+    assert sum(advances) == 150 * 2, "Progress should reach count * len(chains)"
+    
+    print("✓ Wallet generation progress tests passed")
+
+
+if __name__ == '__main__':
+    configure_logging(log_level='WARNING')
+    
+    print("=" * 60)
+    print("Running Wallet Manager Tests")
+    print("=" * 60)
+    
+    try:
+        test_evm_derivation()
+        test_generate_mnemonic()
+        test_generate_wallets_progress()
+        
+        print("\n" + "=" * 60)
+        print("✓ All wallet manager tests passed!")
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -15,6 +15,7 @@ License: MIT
 Repository: https://github.com/BYNNAI/airdrop-farming-bot
 """
 
+import asyncio
 import os
 from datetime import datetime
 from typing import Optional
@@ -41,7 +42,7 @@ class Wallet(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     last_used_at = Column(DateTime)
     nonce = Column(Integer, default=0)
-    enabled = Column(Boolean, default=True)
+    enabled = Column(Boolean, default=True, index=True)
     
     # Relationships
     faucet_requests = relationship("FaucetRequest", back_populates="wallet")
@@ -130,6 +131,7 @@ class WalletAction(Base):
     __table_args__ = (
         Index('idx_action_scheduled', 'scheduled_at', 'status'),
         Index('idx_action_type_chain', 'action_type', 'chain'),
+        Index('idx_action_wallet_status_type', 'wallet_id', 'status', 'action_type'),
     )
 
 
@@ -150,6 +152,7 @@ class FaucetCooldown(Base):
     __table_args__ = (
         Index('idx_cooldown_lookup', 'faucet_name', 'wallet_address', 'chain'),
         Index('idx_cooldown_expiry', 'cooldown_until'),
+        Index('idx_cooldown_chain_wallet', 'chain', 'wallet_address'),
     )
 
 
@@ -189,7 +192,7 @@ class AirdropClaim(Base):
     wallet = relationship("Wallet", backref="airdrop_claims")
     
     __table_args__ = (
-        Index('idx_airdrop_wallet', 'wallet_id', 'airdrop_name'),
+        Index('idx_airdrop_wallet_status', 'wallet_id', 'airdrop_name', 'status'),
         Index('idx_airdrop_status_chain', 'status', 'chain'),
     )
 
@@ -247,6 +250,12 @@ class DatabaseManager:
         # Create all tables
         Base.metadata.create_all(self.engine)
         
+        # create_all() skips tables that already exist, so backfill any
+        # indexes added to the models after the database was first created
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        
     @contextmanager
     def get_session(self) -> Session:
         """Get database session with automatic cleanup.
@@ -292,3 +301,25 @@ def get_db_session() -> Session:
         Database session context manager
     """
     return db_manager.get_session()
+
+
+async def run_db(fn, *args, **kwargs):
+    """Run a blocking database function without stalling the event loop.
+    
+    The call is dispatched to a worker thread so concurrent coroutines keep
+    making progress during disk or network I/O. In-memory SQLite databases
+    live on a single connection that cannot be shared across threads, so
+    those run inline instead.
+    
+    Args:
+        fn: Synchronous callable that opens its own session
+        *args: Positional arguments for ``fn``
+        **kwargs: Keyword arguments for ``fn``
+        
+    Returns:
+        Whatever ``fn`` returns
+    """
+    url = db_manager.engine.url
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return fn(*args, **kwargs)
+    return await asyncio.to_thread(fn, *args, **kwargs)
@@ -0,0 +1,29 @@
+"""
+Environment loading helpers.
+
+This module loads the project's .env file exactly once per process so that
+every entry point can request it without re-reading the file from disk.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BYNNΛI - AirdropFarm
+Sophisticated multi-chain airdrop farming automation
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Author: BYNNΛI
+Project: AirdropFarm
+License: MIT
+Repository: https://github.com/BYNNAI/airdrop-farming-bot
+"""
+
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def ensure_env_loaded() -> bool:
+    """Load environment variables from .env on first call only.
+    
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv()
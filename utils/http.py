@@ -0,0 +1,49 @@
+"""
+Shared HTTP client session helpers.
+
+This module provides a single pooled aiohttp session for a whole CLI run so
+that faucet and API requests reuse keep-alive connections, TLS sessions and
+DNS lookups instead of paying for them on every request.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BYNNΛI - AirdropFarm
+Sophisticated multi-chain airdrop farming automation
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Author: BYNNΛI
+Project: AirdropFarm
+License: MIT
+Repository: https://github.com/BYNNAI/airdrop-farming-bot
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+import aiohttp
+
+
+@asynccontextmanager
+async def shared_session(
+    limit: int = 200,
+    limit_per_host: int = 64,
+    ttl_dns_cache: int = 300,
+    keepalive_timeout: float = 60
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Open a pooled ClientSession that is closed when the block exits.
+    
+    Args:
+        limit: Max simultaneous connections in the pool
+        limit_per_host: Max simultaneous connections to any one host
+        ttl_dns_cache: Seconds to cache DNS lookups
+        keepalive_timeout: Seconds to keep idle connections open
+        
+    Yields:
+        Shared aiohttp ClientSession
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=ttl_dns_cache,
+        keepalive_timeout=keepalive_timeout
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
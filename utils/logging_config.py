@@ -17,12 +17,18 @@ Repository: https://github.com/BYNNAI/airdrop-farming-bot
 
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
+from queue import SimpleQueue
 from pathlib import Path
 from datetime import datetime
 import structlog
 from structlog.types import EventDict, Processor
 
+# Background listener that performs the actual handler I/O
+_queue_listener = None
+
 
 def add_timestamp(logger: logging.Logger, method_name: str, event_dict: EventDict) -> EventDict:
     """Add ISO timestamp to log entries."""
@@ -55,6 +61,9 @@ def configure_logging(
     log_file = log_file or os.getenv("LOG_FILE", "logs/airdrop_farming.log")
     log_format = log_format or os.getenv("LOG_FORMAT", "json")
     
+    # Put back the real handlers if logging was already configured
+    _stop_queue_listener()
+    
     # Create logs directory if it doesn't exist
     if log_file:
         log_path = Path(log_file)
@@ -113,6 +122,54 @@ def configure_logging(
         
         root_logger = logging.getLogger()
         root_logger.addHandler(file_handler)
+    
+    _start_queue_listener()
+
+
+def _start_queue_listener():
+    """Route root handlers through a queue drained by a background thread.
+    
+    Callers only enqueue the record; stream and file writes happen on the
+    listener thread so they never block the event loop.
+    """
+    global _queue_listener
+    
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    if not handlers:
+        return
+    
+    queue = SimpleQueue()
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(queue))
+    
+    _queue_listener = logging.handlers.QueueListener(
+        queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def _stop_queue_listener():
+    """Flush pending records and reattach the real handlers to the root logger."""
+    global _queue_listener
+    
+    if _queue_listener is None:
+        return
+    
+    _queue_listener.stop()
+    
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in _queue_listener.handlers:
+        root_logger.addHandler(handler)
+    
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def get_logger(name: str = None):